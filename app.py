@@ -2,13 +2,26 @@
 Language Trainer Backend (Ancient Greek & Latin - Bulgarian)
 FastAPI application for vocabulary quiz
 """
+import atexit
+import dataclasses
 import json
+import logging
+import logging.handlers
 import os
+import queue
 import random
+import re
+import secrets
+import sys
+import threading
+import time
 import unicodedata
+from collections import OrderedDict
+from functools import lru_cache
+from itertools import chain
+from operator import attrgetter
 from pathlib import Path
-from typing import Dict, List, Optional, Any
-from uuid import uuid4
+from typing import Callable, Dict, List, NamedTuple, Optional, Sequence, Tuple, Union, Any
 from datetime import datetime, timedelta
 
 try:
@@ -24,18 +37,117 @@ try:
 except Exception:  # pragma: no cover
     pass
 
+try:
+    # Optional speedup: orjson parses the data files several times faster than the stdlib
+    import orjson  # type: ignore
+except ImportError:  # pragma: no cover
+    orjson = None
+
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
-from fastapi.responses import FileResponse
+from fastapi.responses import FileResponse, JSONResponse, Response
 from pydantic import BaseModel, Field
 
+# Splits a correct answer into its comma/semicolon-separated variants (but not inside parentheses)
+_VARIANT_SPLIT_RE = re.compile(r'[,;]\s*(?![^()]*\))')
+# Joins variants so they can be normalized in one call: not whitespace, not punctuation, unchanged by case/accent folding
+_VARIANT_SEP = '\x00'
+# Punctuation that is treated as whitespace when comparing answers
+_PUNCT_TO_SPACE = str.maketrans({c: ' ' for c in '()[].,;:'})
+
+# Codepoint ranges covered by the accent-stripping table: Latin-1 through Cyrillic (incl. combining
+# marks and basic Greek) and Latin Extended Additional + polytonic Greek
+_STRIP_ACCENTS_RANGES = ((0x0080, 0x0500), (0x1E00, 0x2000))
+# Any character outside ASCII and the ranges above needs the generic NFD path
+_OUTSIDE_STRIP_TABLE_RE = re.compile(r'[^\x00-\u04ff\u1e00-\u1fff]')
+
+
+def _build_strip_accents_table() -> Dict[int, str]:
+    """Map every accented codepoint in _STRIP_ACCENTS_RANGES to its NFD form without combining marks"""
+    table = {}
+    for start, end in _STRIP_ACCENTS_RANGES:
+        for cp in range(start, end):
+            stripped = ''.join(
+                c for c in unicodedata.normalize('NFD', chr(cp))
+                if unicodedata.category(c) != 'Mn'
+            )
+            if stripped != chr(cp):
+                table[cp] = stripped
+    return table
+
+
+_STRIP_ACCENTS_TABLE = _build_strip_accents_table()
+
+
+# Both normalizers are cached: corpus answers repeat across sessions and users often resubmit the same input
+@lru_cache(maxsize=4096)
+def normalize_with_accents(text: str) -> str:
+    """Normalize text but KEEP accents/diacritics (for Greek comparison)"""
+    # Convert to lowercase (whitespace is collapsed below)
+    text = text.lower()
+    # Normalize common punctuation variations
+    text = text.translate(_PUNCT_TO_SPACE)
+    return ' '.join(text.split())  # Remove all extra whitespace
+
+
+@lru_cache(maxsize=4096)
+def normalize_answer(text: str) -> str:
+    """Normalize text for comparison (case-insensitive, trim, remove extra spaces, punctuation, and accents)"""
+    # Remove diacritics for Greek text comparison (table lookup covers Greek, Cyrillic and Latin scripts).
+    # Pure ASCII input (e.g. Latin answers) has nothing to strip.
+    if text.isascii():
+        pass
+    elif _OUTSIDE_STRIP_TABLE_RE.search(text) is None:
+        text = text.translate(_STRIP_ACCENTS_TABLE)
+    else:
+        text = ''.join(
+            c for c in unicodedata.normalize('NFD', text)
+            if unicodedata.category(c) != 'Mn'
+        )
+    # Convert to lowercase (whitespace is collapsed below)
+    text = text.lower()
+    # Normalize common punctuation variations
+    text = text.translate(_PUNCT_TO_SPACE)
+    return ' '.join(text.split())  # Remove all extra whitespace
+
+
+# App log. Uses its own handler so output looks the same under `python app.py` and `uvicorn app:app`.
+# Records go through a queue and are written by a background thread, so request handlers never block on stdout.
+# Set LOG_LEVEL=DEBUG to see per-request quiz debug output.
+logger = logging.getLogger("langtrainer")
+if not logger.handlers:
+    _log_handler = logging.StreamHandler(sys.stdout)
+    _log_handler.setFormatter(logging.Formatter("[%(asctime)s] %(message)s", datefmt="%Y-%m-%d %H:%M:%S"))
+    _log_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+    _log_listener = logging.handlers.QueueListener(_log_queue, _log_handler)
+    _log_listener.start()
+    atexit.register(_log_listener.stop)
+    logger.addHandler(logging.handlers.QueueHandler(_log_queue))
+    logger.setLevel(os.getenv("LOG_LEVEL", "INFO").upper())
+    logger.propagate = False
+
 
 # ==================== Helper Functions ====================
 
-def get_timestamp():
-    """Get current timestamp in readable format"""
-    return datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+def new_session_id() -> str:
+    """Random URL-safe session ID (cheaper than formatting a UUID)"""
+    return secrets.token_urlsafe(16)
+
+
+def dump_json_bytes(data: Any) -> bytes:
+    """Serialize data to UTF-8 JSON bytes (with orjson when available)"""
+    if orjson is not None:
+        return orjson.dumps(data)
+    return json.dumps(data, ensure_ascii=False).encode("utf-8")
+
+
+def load_json_file(path: Path) -> Any:
+    """Parse a UTF-8 JSON data file (with orjson when available)"""
+    if orjson is not None:
+        return orjson.loads(path.read_bytes())
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
 
 
 # ==================== Models ====================
@@ -68,25 +180,67 @@ class Direction:
     CHEMISTRY_QA = "chemistry_qa"
 
 
-class WordPair(BaseModel):
+class AnswerKey(NamedTuple):
+    """Normalized forms of a correct answer, computed once per word instead of on every submission"""
+    full: str  # Whole answer, accents stripped
+    full_with_accents: str  # Whole answer, accents kept
+    variants: frozenset  # Whole answer + each comma/semicolon-separated variant, accents stripped
+    variants_with_accents: frozenset  # Same, accents kept
+
+
+@dataclasses.dataclass(slots=True, frozen=True)
+class WordPair:
+    """A vocabulary item held in memory (never sent over the API directly, so no pydantic validation)"""
+    bulgarian: str
     greek: Optional[str] = None
     latin: Optional[str] = None
     spanish: Optional[str] = None
-    bulgarian: str
     lesson: Optional[float] = None  # Lesson field (only for Greek words) - supports 32.1, 32.2, etc.
     actual_direction: Optional[str] = None  # For mixed mode: tracks actual direction of this specific word
     words: Optional[Dict[str, str]] = None  # Optional vocabulary hints (Latin word -> Bulgarian translation)
 
+    # field name -> AnswerKey; shared with copies made by dataclasses.replace() so the cache survives them
+    _answer_keys: Dict[str, AnswerKey] = dataclasses.field(default_factory=dict, repr=False, compare=False)
+
+    def answer_key(self, field: str) -> AnswerKey:
+        """Get the normalized answer forms for a text field ("bulgarian", "greek", ...), computing them once"""
+        key = self._answer_keys.get(field)
+        if key is None:
+            key = WordRepository.build_answer_key(getattr(self, field))
+            self._answer_keys[field] = key
+        return key
+
+    def to_response_dict(self, language_field: str) -> Dict[str, Any]:
+        """Shape sent back in QuizStartResponse.word_pairs (and later reused as WordPairRef)"""
+        data = {language_field: getattr(self, language_field), "bulgarian": self.bulgarian, "lesson": self.lesson}
+        # Only mixed Latin/Spanish pairs carry a direction, and only Latin phrases carry word hints
+        if self.actual_direction:
+            data["actual_direction"] = self.actual_direction
+        if self.words:
+            data["words"] = self.words
+        return data
+
+
+class WordPairRef(BaseModel):
+    """A word or subject question echoed back by the client (reused word_pairs or saved progress); unknown keys are ignored"""
+    greek: Optional[str] = None
+    latin: Optional[str] = None
+    spanish: Optional[str] = None
+    bulgarian: Optional[str] = None
+    lesson: Optional[Union[int, float]] = None
+    topic_id: Optional[str] = None  # Literature and other subjects
+    question_id: Optional[str] = None
+
 
 class QuizConfig(BaseModel):
     count: int = Field(default=15, ge=1, le=200)
     direction: str = Field(default=Direction.GREEK_TO_BULGARIAN)
     language_mode: str = Field(default=LanguageMode.GREEK)  # "greek" or "latin"
     time_per_question: int = Field(default=60, ge=10, le=300)  # Time in seconds per question (10s to 5min)
-    word_pairs: Optional[List[Dict[str, Any]]] = None  # For reusing specific words (with lesson as int)
+    word_pairs: Optional[List[WordPairRef]] = None  # For reusing specific words (with lesson as int)
     selected_lessons: Optional[List[float]] = None  # Selected lesson numbers (only for Greek) - supports 32.1, 32.2, etc.
     use_all_words: bool = False  # If True, use all available words from selected lessons
-    exclude_correct_words: Optional[List[Dict[str, Any]]] = None  # Words already answered correctly (to exclude)
+    exclude_correct_words: Optional[List[WordPairRef]] = None  # Words already answered correctly (to exclude)
     random_order: bool = True  # If True, randomize word order; if False, use sequential order
 
     no_time_limit_open: bool = False  # If True, disable time limit for open-ended (LLM-graded) questions
@@ -135,6 +289,9 @@ class QuizSummary(BaseModel):
 
 # ==================== Repository ====================
 
+LESSON_WORDS_CACHE_SIZE = 256  # Lesson selections whose word lists are kept per corpus
+
+
 class WordRepository:
     """Manages word data loading and retrieval for both Greek and Latin"""
     
@@ -159,18 +316,21 @@ class WordRepository:
         
         # Greek data
         self.greek_words: List[WordPair] = []
-        self.greek_words_with_lessons: List[Dict] = []
+        self.greek_lesson_index: Dict[float, List[int]] = {}  # lesson -> positions in greek_words
         
         # Latin data
         self.latin_la_bg: List[WordPair] = []  # Latin -> Bulgarian
         self.latin_bg_la: List[WordPair] = []  # Bulgarian -> Latin
+        self.latin_la_bg_lesson_index: Dict[float, List[int]] = {}  # lesson -> positions in latin_la_bg
+        self.latin_bg_la_lesson_index: Dict[float, List[int]] = {}  # lesson -> positions in latin_bg_la
         self.latin_la_bg_with_lessons: List[Dict] = []  # Raw data with lessons
         self.latin_bg_la_with_lessons: List[Dict] = []  # Raw data with lessons
-        self.latin_qa_with_lessons: List[Dict] = []  # Latin Q&A: [{q, a, Урок}]
+        self.latin_qa: List[WordPair] = []  # Latin Q&A: latin=question, bulgarian=verbatim answer
+        self.latin_qa_lesson_index: Dict[float, List[int]] = {}  # lesson -> positions in latin_qa
 
         # Spanish data (preferred format: like Greek)
         self.spanish_words: List[WordPair] = []
-        self.spanish_words_with_lessons: List[Dict] = []
+        self.spanish_lesson_index: Dict[float, List[int]] = {}  # lesson -> positions in spanish_words
 
         # Spanish data (legacy format: two files, no lessons)
         self.spanish_es_bg: List[WordPair] = []  # Spanish -> Bulgarian
@@ -178,6 +338,10 @@ class WordRepository:
 
         # Verse translation config
         self.verse_lessons_config: List[Dict] = []  # [{lesson, title, language_mode, source}, ...]
+
+        # (corpus attribute, lessons) -> that selection's words; see _lesson_words
+        self._lesson_words_cache: Dict[Tuple[str, frozenset], Tuple[WordPair, ...]] = {}
+        self._lesson_words_lock = threading.Lock()  # Endpoints run in FastAPI's threadpool
         
         self._load_all_data()
     
@@ -196,171 +360,161 @@ class WordRepository:
     def _load_spanish_words(self):
         """Load Spanish words/phrases in Greek-like lesson-based format."""
         if not self.spanish_data_path.exists():
-            print(f"[{get_timestamp()}] ⚠️  Spanish data file not found: {self.spanish_data_path}")
+            logger.warning("⚠️  Spanish data file not found: %s", self.spanish_data_path)
             return
 
-        with open(self.spanish_data_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        data = load_json_file(self.spanish_data_path)
 
-        self.spanish_words_with_lessons = data
         self.spanish_words = [
-            WordPair(spanish=item.get("Лема"), bulgarian=item.get("Превод"), lesson=item.get("Урок"))
+            WordPair(spanish=sys.intern(item.get("Лема")), bulgarian=sys.intern(item.get("Превод")), lesson=item.get("Урок"))
             for item in data
             if item.get("Лема") is not None and item.get("Превод") is not None
         ]
-        print(f"[{get_timestamp()}] ✓ Loaded {len(self.spanish_words)} Spanish word pairs (lesson-based)")
+        self.spanish_words = self.unique_pairs(self.spanish_words, label="Spanish")
+        self.spanish_lesson_index = self.build_lesson_index(self.spanish_words)
+        self.precompute_answer_keys(self.spanish_words)
+        logger.info("✓ Loaded %d Spanish word pairs (lesson-based)", len(self.spanish_words))
 
     def get_spanish_available_lessons(self) -> List[float]:
         """Get sorted list of available lesson numbers (Spanish only)."""
-        lessons = set(item.get("Урок") for item in self.spanish_words_with_lessons if "Урок" in item)
-        return sorted(lessons)
+        return sorted(lesson for lesson in self.spanish_lesson_index if lesson is not None)
 
-    def get_spanish_words_by_lessons(self, lesson_numbers: List[float]) -> List[WordPair]:
+    def get_spanish_words_by_lessons(self, lesson_numbers: List[float]) -> Sequence[WordPair]:
         """Get Spanish word pairs for specific lessons."""
-        filtered_items = [
-            item for item in self.spanish_words_with_lessons
-            if item.get("Урок") in lesson_numbers
-        ]
-        return [
-            WordPair(spanish=item.get("Лема"), bulgarian=item.get("Превод"), lesson=item.get("Урок"))
-            for item in filtered_items
-            if item.get("Лема") is not None and item.get("Превод") is not None
-        ]
+        return self._lesson_words("spanish_words", "spanish_lesson_index", frozenset(lesson_numbers))
     
     def get_latin_available_lessons(self, direction: str = None) -> List[float]:
         """Get sorted list of available lesson numbers for Latin.
         When direction is LATIN_QA, return only Q&A lessons; otherwise return phrase lessons."""
         if direction == Direction.LATIN_QA:
             return self.get_latin_qa_available_lessons()
-        lessons = set()
-        for item in self.latin_la_bg_with_lessons:
-            if "Урок" in item:
-                lessons.add(item["Урок"])
-        for item in self.latin_bg_la_with_lessons:
-            if "Урок" in item:
-                lessons.add(item["Урок"])
-        return sorted(lessons)
-
-    def get_latin_words_by_lessons(self, lesson_numbers: List[float], direction: str = None) -> List[WordPair]:
+        lessons = self.latin_la_bg_lesson_index.keys() | self.latin_bg_la_lesson_index.keys()
+        return sorted(lesson for lesson in lessons if lesson is not None)
+
+    def get_latin_words_by_lessons(self, lesson_numbers: List[float], direction: str = None) -> Sequence[WordPair]:
         """Get Latin word pairs for specific lessons."""
         if direction == Direction.LATIN_QA:
             return self.get_latin_qa_by_lessons(lesson_numbers)
+        lessons = frozenset(lesson_numbers)
         if direction == Direction.LATIN_TO_BULGARIAN:
-            filtered = [item for item in self.latin_la_bg_with_lessons if item.get("Урок") in lesson_numbers]
-            return [WordPair(latin=item["la"], bulgarian=item["bg"], lesson=item.get("Урок"), words=item.get("words")) for item in filtered]
+            return self._lesson_words("latin_la_bg", "latin_la_bg_lesson_index", lessons)
         elif direction == Direction.BULGARIAN_TO_LATIN:
-            filtered = [item for item in self.latin_bg_la_with_lessons if item.get("Урок") in lesson_numbers]
-            return [WordPair(latin=item["la"], bulgarian=item["bg"], lesson=item.get("Урок"), words=item.get("words")) for item in filtered]
-        else:
-            # Return from both files (for mixed mode or general use)
-            la_bg = [WordPair(latin=item["la"], bulgarian=item["bg"], lesson=item.get("Урок"), words=item.get("words")) for item in self.latin_la_bg_with_lessons if item.get("Урок") in lesson_numbers]
-            bg_la = [WordPair(latin=item["la"], bulgarian=item["bg"], lesson=item.get("Урок"), words=item.get("words")) for item in self.latin_bg_la_with_lessons if item.get("Урок") in lesson_numbers]
-            return la_bg + bg_la
+            return self._lesson_words("latin_bg_la", "latin_bg_la_lesson_index", lessons)
+        # Return from both files (for mixed mode or general use)
+        return (
+            self._lesson_words("latin_la_bg", "latin_la_bg_lesson_index", lessons)
+            + self._lesson_words("latin_bg_la", "latin_bg_la_lesson_index", lessons)
+        )
 
     def _load_greek_words(self):
         """Load Greek words from JSON file"""
         if not self.greek_data_path.exists():
-            print(f"[{get_timestamp()}] ⚠️  Greek data file not found: {self.greek_data_path}")
+            logger.warning("⚠️  Greek data file not found: %s", self.greek_data_path)
             return
         
-        with open(self.greek_data_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        data = load_json_file(self.greek_data_path)
         
-        self.greek_words_with_lessons = data  # Store complete data
+        # Words and translations repeat across lessons (and languages); interning lets the repeats share one string
         self.greek_words = [
-            WordPair(greek=item["Лема"], bulgarian=item["Превод"], lesson=item.get("Урок"))
+            WordPair(greek=sys.intern(item["Лема"]), bulgarian=sys.intern(item["Превод"]), lesson=item.get("Урок"))
             for item in data
         ]
-        print(f"[{get_timestamp()}] ✓ Loaded {len(self.greek_words)} Greek word pairs")
+        self.greek_words = self.unique_pairs(self.greek_words, label="Greek")
+        self.greek_lesson_index = self.build_lesson_index(self.greek_words)
+        self.precompute_answer_keys(self.greek_words)
+        logger.info("✓ Loaded %d Greek word pairs", len(self.greek_words))
     
     def _load_latin_phrases(self):
         """Load Latin phrases from JSON files"""
         # Load Latin -> Bulgarian
         if self.latin_la_bg_path.exists():
-            with open(self.latin_la_bg_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            data = load_json_file(self.latin_la_bg_path)
             self.latin_la_bg_with_lessons = data
             self.latin_la_bg = [
-                WordPair(latin=item["la"], bulgarian=item["bg"], lesson=item.get("Урок"), words=item.get("words"))
+                WordPair(latin=sys.intern(item["la"]), bulgarian=sys.intern(item["bg"]), lesson=item.get("Урок"), words=item.get("words"))
                 for item in data
             ]
-            print(f"[{get_timestamp()}] ✓ Loaded {len(self.latin_la_bg)} Latin→Bulgarian phrases")
+            self.latin_la_bg = self.unique_pairs(self.latin_la_bg, label="Latin→Bulgarian")
+            self.latin_la_bg_lesson_index = self.build_lesson_index(self.latin_la_bg)
+            self.precompute_answer_keys(self.latin_la_bg)
+            logger.info("✓ Loaded %d Latin→Bulgarian phrases", len(self.latin_la_bg))
         else:
-            print(f"[{get_timestamp()}] ⚠️  Latin→Bulgarian data file not found: {self.latin_la_bg_path}")
+            logger.warning("⚠️  Latin→Bulgarian data file not found: %s", self.latin_la_bg_path)
         
         # Load Bulgarian -> Latin
         if self.latin_bg_la_path.exists():
-            with open(self.latin_bg_la_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            data = load_json_file(self.latin_bg_la_path)
             self.latin_bg_la_with_lessons = data
             self.latin_bg_la = [
-                WordPair(latin=item["la"], bulgarian=item["bg"], lesson=item.get("Урок"))
+                WordPair(latin=sys.intern(item["la"]), bulgarian=sys.intern(item["bg"]), lesson=item.get("Урок"), words=item.get("words"))
                 for item in data
             ]
-            print(f"[{get_timestamp()}] ✓ Loaded {len(self.latin_bg_la)} Bulgarian→Latin phrases")
+            self.latin_bg_la = self.unique_pairs(self.latin_bg_la, label="Bulgarian→Latin")
+            self.latin_bg_la_lesson_index = self.build_lesson_index(self.latin_bg_la)
+            self.precompute_answer_keys(self.latin_bg_la)
+            logger.info("✓ Loaded %d Bulgarian→Latin phrases", len(self.latin_bg_la))
         else:
-            print(f"[{get_timestamp()}] ⚠️  Bulgarian→Latin data file not found: {self.latin_bg_la_path}")
+            logger.warning("⚠️  Bulgarian→Latin data file not found: %s", self.latin_bg_la_path)
 
     def _load_latin_qa(self):
         """Load Latin Q&A entries (open question + verbatim Bulgarian answer)."""
         if not self.latin_qa_path.exists():
-            print(f"[{get_timestamp()}] ⚠️  Latin Q&A data file not found: {self.latin_qa_path}")
+            logger.warning("⚠️  Latin Q&A data file not found: %s", self.latin_qa_path)
             return
-        with open(self.latin_qa_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-        self.latin_qa_with_lessons = data
-        print(f"[{get_timestamp()}] ✓ Loaded {len(self.latin_qa_with_lessons)} Latin Q&A entries")
+        data = load_json_file(self.latin_qa_path)
+        self.latin_qa = [
+            WordPair(latin=item["q"], bulgarian=item["a"], lesson=item.get("Урок"))
+            for item in data
+            if item.get("q") is not None and item.get("a") is not None
+        ]
+        self.latin_qa_lesson_index = self.build_lesson_index(self.latin_qa)
+        self.precompute_answer_keys(self.latin_qa)
+        logger.info("✓ Loaded %d Latin Q&A entries", len(self.latin_qa))
 
     def get_latin_qa_available_lessons(self) -> List[float]:
         """Return sorted list of lessons present in the Latin Q&A file."""
-        return sorted({item.get("Урок") for item in self.latin_qa_with_lessons if item.get("Урок") is not None})
+        return sorted(lesson for lesson in self.latin_qa_lesson_index if lesson is not None)
 
-    def get_latin_qa_by_lessons(self, lesson_numbers: List[float]) -> List[WordPair]:
+    def get_latin_qa_by_lessons(self, lesson_numbers: List[float]) -> Sequence[WordPair]:
         """Return Latin Q&A items as WordPair (latin=question, bulgarian=verbatim answer)."""
-        filtered = [item for item in self.latin_qa_with_lessons if item.get("Урок") in lesson_numbers]
-        return [
-            WordPair(latin=item["q"], bulgarian=item["a"], lesson=item.get("Урок"))
-            for item in filtered
-            if item.get("q") is not None and item.get("a") is not None
-        ]
+        return self._lesson_words("latin_qa", "latin_qa_lesson_index", frozenset(lesson_numbers))
 
     def _load_spanish_phrases(self):
         """Load Spanish phrases from JSON files"""
         # Load Spanish -> Bulgarian
         if self.spanish_es_bg_path.exists():
-            with open(self.spanish_es_bg_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            data = load_json_file(self.spanish_es_bg_path)
             self.spanish_es_bg = [
-                WordPair(spanish=item.get("es"), bulgarian=item["bg"])
+                WordPair(spanish=sys.intern(item.get("es")), bulgarian=sys.intern(item["bg"]))
                 for item in data
                 if item.get("es") is not None and item.get("bg") is not None
             ]
-            print(f"[{get_timestamp()}] ✓ Loaded {len(self.spanish_es_bg)} Spanish→Bulgarian phrases")
+            self.precompute_answer_keys(self.spanish_es_bg)
+            logger.info("✓ Loaded %d Spanish→Bulgarian phrases", len(self.spanish_es_bg))
         else:
-            print(f"[{get_timestamp()}] ⚠️  Spanish→Bulgarian data file not found: {self.spanish_es_bg_path}")
+            logger.warning("⚠️  Spanish→Bulgarian data file not found: %s", self.spanish_es_bg_path)
 
         # Load Bulgarian -> Spanish
         if self.spanish_bg_es_path.exists():
-            with open(self.spanish_bg_es_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            data = load_json_file(self.spanish_bg_es_path)
             self.spanish_bg_es = [
-                WordPair(spanish=item.get("es"), bulgarian=item["bg"])
+                WordPair(spanish=sys.intern(item.get("es")), bulgarian=sys.intern(item["bg"]))
                 for item in data
                 if item.get("es") is not None and item.get("bg") is not None
             ]
-            print(f"[{get_timestamp()}] ✓ Loaded {len(self.spanish_bg_es)} Bulgarian→Spanish phrases")
+            self.precompute_answer_keys(self.spanish_bg_es)
+            logger.info("✓ Loaded %d Bulgarian→Spanish phrases", len(self.spanish_bg_es))
         else:
-            print(f"[{get_timestamp()}] ⚠️  Bulgarian→Spanish data file not found: {self.spanish_bg_es_path}")
+            logger.warning("⚠️  Bulgarian→Spanish data file not found: %s", self.spanish_bg_es_path)
 
     def _load_verse_config(self):
         """Load verse-translation lesson configuration."""
         if self.verse_lessons_config_path.exists():
-            with open(self.verse_lessons_config_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            data = load_json_file(self.verse_lessons_config_path)
             self.verse_lessons_config = data.get("verse_lessons", [])
-            print(f"[{get_timestamp()}] ✓ Loaded {len(self.verse_lessons_config)} verse lesson config(s)")
+            logger.info("✓ Loaded %d verse lesson config(s)", len(self.verse_lessons_config))
         else:
-            print(f"[{get_timestamp()}] ⚠️  Verse lessons config not found: {self.verse_lessons_config_path}")
+            logger.warning("⚠️  Verse lessons config not found: %s", self.verse_lessons_config_path)
 
     def get_verse_lesson_numbers(self) -> List[float]:
         """Return lesson numbers that support verse translation."""
@@ -380,7 +534,7 @@ class WordRepository:
             if item.get("Урок") == lesson
         ]
     
-    def get_words_for_language_and_direction(self, language_mode: str, direction: str) -> List[WordPair]:
+    def get_words_for_language_and_direction(self, language_mode: str, direction: str) -> Sequence[WordPair]:
         """Get words based on language mode and direction"""
         if language_mode == LanguageMode.GREEK:
             return self.greek_words
@@ -411,19 +565,11 @@ class WordRepository:
     
     def get_available_lessons(self) -> List[float]:
         """Get sorted list of all available lesson numbers (Greek only)"""
-        lessons = set(item.get("Урок") for item in self.greek_words_with_lessons if "Урок" in item)
-        return sorted(lessons)
+        return sorted(lesson for lesson in self.greek_lesson_index if lesson is not None)
     
-    def get_words_by_lessons(self, lesson_numbers: List[float]) -> List[WordPair]:
+    def get_words_by_lessons(self, lesson_numbers: List[float]) -> Sequence[WordPair]:
         """Get all words from specific lessons (Greek only) - supports both int (26, 27) and float (32.1, 32.2)"""
-        filtered_items = [
-            item for item in self.greek_words_with_lessons
-            if item.get("Урок") in lesson_numbers
-        ]
-        return [
-            WordPair(greek=item["Лема"], bulgarian=item["Превод"], lesson=item.get("Урок"))
-            for item in filtered_items
-        ]
+        return self._lesson_words("greek_words", "greek_lesson_index", frozenset(lesson_numbers))
     
     def get_random_pairs(self, count: int, language_mode: str = LanguageMode.GREEK, 
                         direction: str = Direction.GREEK_TO_BULGARIAN,
@@ -431,46 +577,113 @@ class WordRepository:
         """Get random word pairs without replacement"""
         if language_mode == LanguageMode.GREEK:
             if lesson_numbers:
+                # Only the selected lessons' rows are visited, via the lesson index; no WordPair is built
                 available_words = self.get_words_by_lessons(lesson_numbers)
             else:
                 available_words = self.greek_words
         else:  # Latin
             available_words = self.get_words_for_language_and_direction(language_mode, direction)
         
-        if count > len(available_words):
-            count = len(available_words)
-        return random.sample(available_words, count)
+        # random.sample already does a partial Fisher-Yates (or set-based picks for large lists) over references
+        return random.sample(available_words, min(count, len(available_words)))
     
+    def _lesson_words(self, pairs_attr: str, index_attr: str, lessons: frozenset) -> Tuple[WordPair, ...]:
+        """Words of the given lessons from one corpus list, in file order.
+
+        Cached per lesson selection because the corpora never change after load, so repeat quiz starts share
+        one result. It is a tuple so no caller can reorder or filter it in place for everyone else.
+        """
+        key = (pairs_attr, lessons)
+        with self._lesson_words_lock:
+            words = self._lesson_words_cache.get(key)
+            if words is None:
+                if len(self._lesson_words_cache) >= LESSON_WORDS_CACHE_SIZE:
+                    # Forget the oldest selection (dicts keep insertion order)
+                    del self._lesson_words_cache[next(iter(self._lesson_words_cache))]
+                words = tuple(self.gather_lessons(getattr(self, pairs_attr), getattr(self, index_attr), lessons))
+                self._lesson_words_cache[key] = words
+        return words
+
     @staticmethod
-    def normalize_with_accents(text: str) -> str:
-        """Normalize text but KEEP accents/diacritics (for Greek comparison)"""
-        # Convert to lowercase and normalize whitespace
-        text = text.lower().strip()
-        # Normalize common punctuation variations
-        text = text.replace('(', ' ').replace(')', ' ')
-        text = text.replace('[', ' ').replace(']', ' ')
-        text = text.replace('.', ' ').replace(',', ' ')
-        text = text.replace(';', ' ').replace(':', ' ')
-        text = text.replace('  ', ' ')  # Double spaces to single
-        return ' '.join(text.split())  # Remove all extra whitespace
-    
+    def build_lesson_index(pairs: List[WordPair]) -> Dict[float, List[int]]:
+        """Map each lesson to the positions of its words in pairs"""
+        index: Dict[float, List[int]] = {}
+        for i, pair in enumerate(pairs):
+            index.setdefault(pair.lesson, []).append(i)
+        return index
+
     @staticmethod
-    def normalize_answer(text: str) -> str:
-        """Normalize text for comparison (case-insensitive, trim, remove extra spaces, punctuation, and accents)"""
-        # Remove diacritics for Greek text comparison
-        text = ''.join(
-            c for c in unicodedata.normalize('NFD', text)
-            if unicodedata.category(c) != 'Mn'
+    def gather_lessons(pairs: List[WordPair], index: Dict[float, List[int]], lesson_numbers: List[float]) -> List[WordPair]:
+        """Words of the given lessons in file order, looked up through a lesson index instead of a full scan"""
+        positions = sorted(chain.from_iterable(index.get(lesson, ()) for lesson in set(lesson_numbers)))
+        return [pairs[i] for i in positions]
+
+    @staticmethod
+    def unique_pairs(pairs: List[WordPair], label: Optional[str] = None) -> List[WordPair]:
+        """Drop rows repeated within the same lesson, keeping the first occurrence.
+
+        Words deliberately reappear in later lessons (and progress is tracked per lesson), so those are kept.
+        """
+        seen = set()
+        unique = []
+        for pair in pairs:
+            key = (pair.greek, pair.latin, pair.spanish, pair.bulgarian, pair.lesson)
+            if key not in seen:
+                seen.add(key)
+                unique.append(pair)
+        if label and len(unique) < len(pairs):
+            logger.info("Dropped %d duplicate %s row(s)", len(pairs) - len(unique), label)
+        return unique
+
+    @staticmethod
+    def answered_keys(field: str, words: List[WordPairRef]) -> frozenset:
+        """(field, bulgarian) keys of the words the client reports as already answered correctly"""
+        return frozenset((getattr(wp, field), wp.bulgarian) for wp in words)
+
+    @staticmethod
+    def drop_answered(pairs: Sequence[WordPair], field: str, answered: frozenset) -> Sequence[WordPair]:
+        """Filter out pairs whose (field, bulgarian) key is in answered.
+
+        Keys are tuples of the pairs' own strings, whose hashes are cached after the first lookup,
+        so each membership test only combines two cached hashes.
+        """
+        if not answered:
+            return pairs
+        key = attrgetter(field, "bulgarian")
+        return [wp for wp in pairs if key(wp) not in answered]
+
+    @staticmethod
+    def precompute_answer_keys(pairs: List[WordPair]):
+        """Warm the AnswerKey cache of every populated text field so quizzes never normalize correct answers"""
+        for pair in pairs:
+            for field in ("greek", "latin", "spanish", "bulgarian"):
+                if getattr(pair, field) is not None:
+                    pair.answer_key(field)
+
+    @staticmethod
+    def build_answer_key(text: str) -> AnswerKey:
+        """Split a correct answer into its variants and normalize everything with and without accents"""
+        full = normalize_answer(text)
+        full_with_accents = normalize_with_accents(text)
+        variants = _VARIANT_SPLIT_RE.split(text)
+        if len(variants) == 1:
+            # Single-variant answer (the common case): the variant *is* the full answer, don't normalize it twice
+            return AnswerKey(full, full_with_accents, frozenset((full,)), frozenset((full_with_accents,)))
+        # Normalize all variants in one pass over the joined string; whitespace is already collapsed, so only the
+        # single spaces next to the separator need stripping
+        joined = _VARIANT_SEP.join(variants)
+        return AnswerKey(
+            full=full,
+            full_with_accents=full_with_accents,
+            variants=frozenset([full, *(v.strip() for v in normalize_answer(joined).split(_VARIANT_SEP))]),
+            variants_with_accents=frozenset(
+                [full_with_accents, *(v.strip() for v in normalize_with_accents(joined).split(_VARIANT_SEP))]
+            ),
         )
-        # Convert to lowercase and normalize whitespace
-        text = text.lower().strip()
-        # Normalize common punctuation variations
-        text = text.replace('(', ' ').replace(')', ' ')
-        text = text.replace('[', ' ').replace(']', ' ')
-        text = text.replace('.', ' ').replace(',', ' ')
-        text = text.replace(';', ' ').replace(':', ' ')
-        text = text.replace('  ', ' ')  # Double spaces to single
-        return ' '.join(text.split())  # Remove all extra whitespace
+
+    # Kept as WordRepository attributes for existing callers
+    normalize_with_accents = staticmethod(normalize_with_accents)
+    normalize_answer = staticmethod(normalize_answer)
 
 
 # ==================== Literature (BG) ====================
@@ -560,7 +773,47 @@ class VerseTranslationGrader:
             return 0, "Грешка при оценяването: неуспешно парсване на отговор от модела."
 
 
-class VerseTranslationSession:
+class QuestionTimerMixin:
+    """Per-question time limits, tracked as monotonic deadlines (immune to wall-clock changes)"""
+    time_per_question: int
+    question_deadlines: List[Optional[float]]  # Indexed by question; None until the question is started
+    clock: Callable[[], float] = time.monotonic  # Monotonic time source (sessions may be given a fake one in tests)
+
+    def start_question(self, index: int):
+        """Mark the start time for a question"""
+        self.question_deadlines[index] = self.clock() + self.time_per_question
+
+    def is_timed_out(self, index: int) -> bool:
+        """Check if the time limit has been exceeded for this question"""
+        deadline = self.question_deadlines[index]
+        return deadline is not None and self.clock() > deadline
+
+    def question_started_at(self, index: int) -> Optional[datetime]:
+        """Wall-clock time the question was started (for API responses), or None if not started"""
+        deadline = self.question_deadlines[index]
+        if deadline is None:
+            return None
+        return datetime.now() - timedelta(seconds=self.clock() - (deadline - self.time_per_question))
+
+
+class RunningScoreMixin:
+    """Keeps total_score/total_answered up to date as answers come in, so submissions don't re-sum the quiz"""
+    answers: List[Optional[float]]
+    total_score: float = 0.0
+    total_answered: int = 0
+
+    def _record_score(self, index: int, score: float):
+        previous = self.answers[index]
+        self.answers[index] = score
+        if previous is None:
+            self.total_answered += 1
+            self.total_score += score
+        else:
+            # Re-answered question: re-sum rather than subtract so float totals stay exact
+            self.total_score = sum(ans for ans in self.answers if ans is not None)
+
+
+class VerseTranslationSession(QuestionTimerMixin, RunningScoreMixin):
     """An active verse-translation quiz session."""
 
     def __init__(self, session_id: str, lesson: float, groups: List[VerseGroup],
@@ -574,19 +827,9 @@ class VerseTranslationSession:
         self.user_answers: List[str] = [""] * len(groups)
         self.score_percents: List[Optional[int]] = [None] * len(groups)
         self.notes: List[Optional[str]] = [None] * len(groups)
-        self.question_start_times: Dict[int, datetime] = {}
+        self.question_deadlines: List[Optional[float]] = [None] * len(groups)
         self._grader = grader
 
-    # --- Timer helpers (same interface as other sessions) ---
-    def start_question(self, index: int):
-        self.question_start_times[index] = datetime.now()
-
-    def is_timed_out(self, index: int) -> bool:
-        if index not in self.question_start_times:
-            return False
-        elapsed = datetime.now() - self.question_start_times[index]
-        return elapsed.total_seconds() > self.time_per_question
-
     # --- Question / answer ---
     def get_question(self, index: int) -> Dict[str, Any]:
         if index >= len(self.word_pairs):
@@ -613,7 +856,7 @@ class VerseTranslationSession:
         self.user_answers[index] = user_answer
 
         if timed_out:
-            self.answers[index] = 0.0
+            self._record_score(index, 0.0)
             self.score_percents[index] = 0
             self.notes[index] = "Времето изтече."
             return 0.0, False, True
@@ -629,12 +872,12 @@ class VerseTranslationSession:
         )
         self.score_percents[index] = score_percent
         self.notes[index] = notes
-        self.answers[index] = score_percent / 100.0
+        self._record_score(index, score_percent / 100.0)
         return self.answers[index] or 0.0, False, False
 
     def get_summary(self) -> QuizSummary:
         total = len(self.word_pairs)
-        total_score = sum(ans for ans in self.answers if ans is not None)
+        total_score = self.total_score
         score_percentage = (total_score / total * 100) if total > 0 else 0
 
         correct_count = 0
@@ -695,19 +938,19 @@ class LiteratureRepository:
 
     def _load_topics(self) -> None:
         if not self.data_dir.exists():
-            print(f"[{get_timestamp()}] ⚠️  Literature data dir not found: {self.data_dir}")
+            logger.warning("⚠️  Literature data dir not found: %s", self.data_dir)
             return
 
         for path in sorted(self.data_dir.glob("*.json")):
             try:
-                payload = json.loads(path.read_text(encoding="utf-8"))
+                payload = load_json_file(path)
                 topic = LiteratureTopic(**payload)
                 self.topics[topic.topic_id] = topic
             except Exception as e:
-                print(f"[{get_timestamp()}] ⚠️  Failed loading literature topic {path}: {e}")
+                logger.warning("⚠️  Failed loading literature topic %s: %s", path, e)
 
         if self.topics:
-            print(f"[{get_timestamp()}] ✓ Loaded {len(self.topics)} literature topic(s)")
+            logger.info("✓ Loaded %d literature topic(s)", len(self.topics))
 
     def list_topics(self) -> List[Dict[str, Any]]:
         return [
@@ -754,12 +997,12 @@ class BiologyRepository:
 
     def _load_all(self) -> None:
         if not self.data_dir.exists():
-            print(f"[{get_timestamp()}] ⚠️  Biology data dir not found: {self.data_dir}")
+            logger.warning("⚠️  Biology data dir not found: %s", self.data_dir)
             return
 
         for path in sorted(self.data_dir.glob("*.json")):
             try:
-                payload = json.loads(path.read_text(encoding="utf-8"))
+                payload = load_json_file(path)
                 if path.stem.endswith("_study_guide"):
                     topic_id = payload.get("topic_id")
                     if topic_id:
@@ -777,9 +1020,9 @@ class BiologyRepository:
                             "final_recap": payload.get("final_recap"),
                         }
             except Exception as e:
-                print(f"[{get_timestamp()}] ⚠️  Failed loading biology file {path}: {e}")
+                logger.warning("⚠️  Failed loading biology file %s: %s", path, e)
 
-        print(f"[{get_timestamp()}] ✓ Loaded {len(self.topics)} biology topic(s) and {len(self.study_guides)} study guide(s)")
+        logger.info("✓ Loaded %d biology topic(s) and %d study guide(s)", len(self.topics), len(self.study_guides))
 
     def list_topics(self) -> List[Dict[str, Any]]:
         return [
@@ -968,7 +1211,7 @@ class CrossExamSession:
 
     @property
     def total_answered(self) -> int:
-        return sum(1 for a in self.answers if a is not None)
+        return len(self.answers) - self.answers.count(None)
 
     def get_summary(self) -> Dict:
         answered_indices = [i for i, a in enumerate(self.answers) if a is not None]
@@ -1146,7 +1389,7 @@ class CrossExamGenerator:
             return 0, "Грешка при оценяването: неуспешно парсване на отговора от модела."
 
 
-class LiteratureSession:
+class LiteratureSession(QuestionTimerMixin, RunningScoreMixin):
     """Represents an active literature session (topic-based)."""
 
     def __init__(self, session_id: str, topic_id: str, questions: List[LiteratureQuestion], direction: str, time_per_question: int,
@@ -1161,22 +1404,16 @@ class LiteratureSession:
         self.user_answers: List[str] = [""] * len(questions)
         self.score_percents: List[Optional[int]] = [None] * len(questions)
         self.notes: List[Optional[str]] = [None] * len(questions)
-        self.question_start_times: Dict[int, datetime] = {}
+        self.question_deadlines: List[Optional[float]] = [None] * len(questions)
         self._grader = grader
 
-    def start_question(self, index: int):
-        self.question_start_times[index] = datetime.now()
-
     def is_timed_out(self, index: int) -> bool:
-        if index not in self.question_start_times:
-            return False
         # Skip timeout for open-ended questions when no_time_limit_open is set
         if self.no_time_limit_open:
             q = self.word_pairs[index]
             if not q.choices:
                 return False
-        elapsed = datetime.now() - self.question_start_times[index]
-        return elapsed.total_seconds() > self.time_per_question
+        return super().is_timed_out(index)
 
     def get_question(self, index: int) -> Dict[str, str]:
         if index >= len(self.word_pairs):
@@ -1211,7 +1448,7 @@ class LiteratureSession:
         self.user_answers[index] = user_answer
 
         if timed_out:
-            self.answers[index] = 0.0
+            self._record_score(index, 0.0)
             self.score_percents[index] = 0
             self.notes[index] = "Времето изтече."
             return 0.0, False, True
@@ -1225,7 +1462,7 @@ class LiteratureSession:
             score = 100 if given == correct else 0
             self.score_percents[index] = score
             self.notes[index] = None if score == 100 else f"Правилен избор: {correct}."
-            self.answers[index] = score / 100.0
+            self._record_score(index, score / 100.0)
             return self.answers[index] or 0.0, False, False
 
         # Open-ended: LLM grading
@@ -1236,12 +1473,12 @@ class LiteratureSession:
         )
         self.score_percents[index] = score_percent
         self.notes[index] = notes
-        self.answers[index] = score_percent / 100.0
+        self._record_score(index, score_percent / 100.0)
         return self.answers[index] or 0.0, False, False
 
     def get_summary(self) -> QuizSummary:
         total = len(self.word_pairs)
-        total_score = sum(ans for ans in self.answers if ans is not None)
+        total_score = self.total_score
         score_percentage = (total_score / total * 100) if total > 0 else 0
 
         # Consider "correct" if above threshold
@@ -1272,163 +1509,79 @@ class LiteratureSession:
 
 # ==================== Quiz Session Manager ====================
 
-class QuizSession:
+# Single quiz direction -> (prompt field, prompt label, answer field, language field the pair must have)
+QUIZ_DIRECTIONS: Dict[str, tuple] = {
+    Direction.GREEK_TO_BULGARIAN: ("greek", "Ancient Greek", "bulgarian", "greek"),
+    Direction.BULGARIAN_TO_GREEK: ("bulgarian", "Bulgarian", "greek", "greek"),
+    Direction.LATIN_TO_BULGARIAN: ("latin", "Latin", "bulgarian", "latin"),
+    Direction.BULGARIAN_TO_LATIN: ("bulgarian", "Bulgarian", "latin", "latin"),
+    Direction.LATIN_QA: ("latin", "Въпрос", "bulgarian", "latin"),
+    Direction.SPANISH_TO_BULGARIAN: ("spanish", "Spanish", "bulgarian", "spanish"),
+    Direction.BULGARIAN_TO_SPANISH: ("bulgarian", "Bulgarian", "spanish", "spanish"),
+}
+# Mixed direction -> its two halves (even / odd index fallback order)
+MIXED_DIRECTIONS: Dict[str, tuple] = {
+    Direction.LATIN_MIXED: (Direction.LATIN_TO_BULGARIAN, Direction.BULGARIAN_TO_LATIN),
+    Direction.SPANISH_MIXED: (Direction.SPANISH_TO_BULGARIAN, Direction.BULGARIAN_TO_SPANISH),
+}
+
+
+class QuizSession(QuestionTimerMixin, RunningScoreMixin):
     """Represents an active quiz session"""
     
-    def __init__(self, session_id: str, word_pairs: List[WordPair], direction: str, time_per_question: int):
+    def __init__(self, session_id: str, word_pairs: List[WordPair], direction: str, time_per_question: int,
+                 clock: Callable[[], float] = time.monotonic):
         self.session_id = session_id
         self.word_pairs = word_pairs
         self.direction = direction
         self.time_per_question = time_per_question  # Time limit in seconds
+        self.clock = clock
         self.answers: List[Optional[float]] = [None] * len(word_pairs)  # Changed to float for partial credit
         self.user_answers: List[str] = [""] * len(word_pairs)
-        self.question_start_times: Dict[int, datetime] = {}  # Track when each question was started
-    
-    def start_question(self, index: int):
-        """Mark the start time for a question"""
-        self.question_start_times[index] = datetime.now()
-    
-    def is_timed_out(self, index: int) -> bool:
-        """Check if the time limit has been exceeded for this question"""
-        if index not in self.question_start_times:
-            return False
-        
-        elapsed = datetime.now() - self.question_start_times[index]
-        return elapsed.total_seconds() > self.time_per_question
+        self.question_deadlines: List[Optional[float]] = [None] * len(word_pairs)  # Set when each question is started
+        # Questions and correct answers never change during a session, so resolve the direction once
+        self._answer_fields: List[str] = [self._answer_field(i) for i in range(len(word_pairs))]
+        self.questions: List[Dict[str, str]] = [self._build_question(i) for i in range(len(word_pairs))]
+        self.correct_answers: List[str] = [
+            getattr(pair, field) for pair, field in zip(word_pairs, self._answer_fields)
+        ]
+        # Greek answers earn half credit when only the accents are wrong (_build_question rejects pairs without Greek)
+        self._accent_sensitive = direction in (Direction.GREEK_TO_BULGARIAN, Direction.BULGARIAN_TO_GREEK)
     
     def get_question(self, index: int) -> Dict[str, str]:
         """Get question at index"""
         if index >= len(self.word_pairs):
             raise IndexError(f"Question index {index} out of range")
-        
+        return self.questions[index]
+    
+    def _build_question(self, index: int) -> Dict[str, str]:
+        """Build the question payload for index (called once per question from __init__)"""
         pair = self.word_pairs[index]
-        
-        # Auto-detect language based on which field is populated
-        has_greek = pair.greek is not None
-        has_latin = pair.latin is not None
-        has_spanish = pair.spanish is not None
-        
-        # Handle Greek questions
-        if self.direction == Direction.GREEK_TO_BULGARIAN and has_greek:
-            return {
-                "question_id": str(index),
-                "prompt": pair.greek,
-                "prompt_label": "Ancient Greek"
-            }
-        elif self.direction == Direction.BULGARIAN_TO_GREEK and has_greek:
-            return {
-                "question_id": str(index),
-                "prompt": pair.bulgarian,
-                "prompt_label": "Bulgarian"
-            }
-        # Handle Latin questions
-        elif self.direction == Direction.LATIN_TO_BULGARIAN and has_latin:
-            q = {
-                "question_id": str(index),
-                "prompt": pair.latin,
-                "prompt_label": "Latin"
-            }
-            if pair.words:
-                q["words"] = pair.words
-            return q
-        elif self.direction == Direction.LATIN_QA and has_latin:
-            return {
-                "question_id": str(index),
-                "prompt": pair.latin,
-                "prompt_label": "Въпрос"
-            }
-        elif self.direction == Direction.BULGARIAN_TO_LATIN and has_latin:
-            return {
-                "question_id": str(index),
-                "prompt": pair.bulgarian,
-                "prompt_label": "Bulgarian"
-            }
-        elif self.direction == Direction.LATIN_MIXED and has_latin:
-            # For mixed mode, use the actual_direction field set during interleaving
-            # This handles uneven list lengths correctly
-            if pair.actual_direction == Direction.LATIN_TO_BULGARIAN:
-                q = {
-                    "question_id": str(index),
-                    "prompt": pair.latin,
-                    "prompt_label": "Latin"
-                }
-                if pair.words:
-                    q["words"] = pair.words
-                return q
-            elif pair.actual_direction == Direction.BULGARIAN_TO_LATIN:
-                q = {
-                    "question_id": str(index),
-                    "prompt": pair.bulgarian,
-                    "prompt_label": "Bulgarian"
-                }
-                if pair.words:
-                    q["words"] = pair.words
-                return q
-            else:
-                # Fallback to index-based if actual_direction not set (shouldn't happen)
-                if index % 2 == 0:
-                    q = {
-                        "question_id": str(index),
-                        "prompt": pair.latin,
-                        "prompt_label": "Latin"
-                    }
-                    if pair.words:
-                        q["words"] = pair.words
-                    return q
-                else:
-                    q = {
-                        "question_id": str(index),
-                        "prompt": pair.bulgarian,
-                        "prompt_label": "Bulgarian"
-                    }
-                    if pair.words:
-                        q["words"] = pair.words
-                    return q
-
-        # Handle Spanish questions
-        elif self.direction == Direction.SPANISH_TO_BULGARIAN and has_spanish:
-            return {
-                "question_id": str(index),
-                "prompt": pair.spanish,
-                "prompt_label": "Spanish"
-            }
-        elif self.direction == Direction.BULGARIAN_TO_SPANISH and has_spanish:
-            return {
-                "question_id": str(index),
-                "prompt": pair.bulgarian,
-                "prompt_label": "Bulgarian"
-            }
-        elif self.direction == Direction.SPANISH_MIXED and has_spanish:
-            if pair.actual_direction == Direction.SPANISH_TO_BULGARIAN:
-                return {
-                    "question_id": str(index),
-                    "prompt": pair.spanish,
-                    "prompt_label": "Spanish"
-                }
-            elif pair.actual_direction == Direction.BULGARIAN_TO_SPANISH:
-                return {
-                    "question_id": str(index),
-                    "prompt": pair.bulgarian,
-                    "prompt_label": "Bulgarian"
-                }
-            else:
-                if index % 2 == 0:
-                    return {
-                        "question_id": str(index),
-                        "prompt": pair.spanish,
-                        "prompt_label": "Spanish"
-                    }
-                else:
-                    return {
-                        "question_id": str(index),
-                        "prompt": pair.bulgarian,
-                        "prompt_label": "Bulgarian"
-                    }
-        
-        # Fallback error
-        raise ValueError(
-            f"Invalid word pair for direction {self.direction}: greek={pair.greek}, latin={pair.latin}, spanish={pair.spanish}"
-        )
+        prompt_field, prompt_label, _, language_field = QUIZ_DIRECTIONS[self._pair_direction(index)]
+        if getattr(pair, language_field) is None:
+            raise ValueError(
+                f"Invalid word pair for direction {self.direction}: greek={pair.greek}, latin={pair.latin}, spanish={pair.spanish}"
+            )
+        q = {
+            "question_id": str(index),
+            "prompt": getattr(pair, prompt_field),
+            "prompt_label": prompt_label
+        }
+        # Word-by-word hints: Latin → Bulgarian questions, and both halves of Latin mixed mode
+        if pair.words and (self.direction == Direction.LATIN_MIXED or self.direction == Direction.LATIN_TO_BULGARIAN):
+            q["words"] = pair.words
+        return q
+    
+    def _pair_direction(self, index: int) -> str:
+        """Single direction of a question; in mixed modes each pair carries its own (set during interleaving)"""
+        halves = MIXED_DIRECTIONS.get(self.direction)
+        if halves is None:
+            return self.direction
+        actual_direction = self.word_pairs[index].actual_direction
+        if actual_direction in halves:
+            return actual_direction
+        # Fallback to index-based if actual_direction not set (shouldn't happen)
+        return halves[index % 2]
     
     def check_answer(self, index: int, user_answer: str) -> tuple[float, bool, bool]:
         """
@@ -1449,258 +1602,105 @@ class QuizSession:
         timed_out = self.is_timed_out(index)
         
         pair = self.word_pairs[index]
-        
-        # Auto-detect language based on which field is populated
-        has_greek = pair.greek is not None
-        has_latin = pair.latin is not None
-        has_spanish = pair.spanish is not None
-        
-        # Determine correct answer based on direction and available data
-        if self.direction in [Direction.GREEK_TO_BULGARIAN, Direction.LATIN_TO_BULGARIAN, Direction.SPANISH_TO_BULGARIAN, Direction.LATIN_QA]:
-            correct_answer = pair.bulgarian
-        elif self.direction == Direction.BULGARIAN_TO_GREEK and has_greek:
-            correct_answer = pair.greek
-        elif self.direction == Direction.BULGARIAN_TO_LATIN and has_latin:
-            correct_answer = pair.latin
-        elif self.direction == Direction.BULGARIAN_TO_SPANISH and has_spanish:
-            correct_answer = pair.spanish
-        elif self.direction == Direction.LATIN_MIXED and has_latin:
-            # In mixed mode, use the actual_direction field
-            if pair.actual_direction == Direction.LATIN_TO_BULGARIAN:
-                correct_answer = pair.bulgarian  # Latin -> Bulgarian
-            elif pair.actual_direction == Direction.BULGARIAN_TO_LATIN:
-                correct_answer = pair.latin  # Bulgarian -> Latin
-            else:
-                # Fallback to index-based if actual_direction not set
-                if index % 2 == 0:
-                    correct_answer = pair.bulgarian  # Latin -> Bulgarian
-                else:
-                    correct_answer = pair.latin  # Bulgarian -> Latin
-        elif self.direction == Direction.SPANISH_MIXED and has_spanish:
-            if pair.actual_direction == Direction.SPANISH_TO_BULGARIAN:
-                correct_answer = pair.bulgarian  # Spanish -> Bulgarian
-            elif pair.actual_direction == Direction.BULGARIAN_TO_SPANISH:
-                correct_answer = pair.spanish  # Bulgarian -> Spanish
-            else:
-                if index % 2 == 0:
-                    correct_answer = pair.bulgarian
-                else:
-                    correct_answer = pair.spanish
-        else:
-            raise ValueError(f"Cannot determine correct answer for direction {self.direction}")
+        answer_field = self._answer_fields[index]
         
         # If timed out, automatically mark as incorrect
         if timed_out:
-            self.answers[index] = 0.0
+            self._record_score(index, 0.0)
             self.user_answers[index] = user_answer
             return 0.0, False, True
         
-        # Normalize both answers (without accents) for basic comparison
-        normalized_user = WordRepository.normalize_answer(user_answer)
-        normalized_correct = WordRepository.normalize_answer(correct_answer)
+        # Verbatim correct answer (the usual case for a trained user): full marks in every direction, no normalizing
+        if user_answer == self.correct_answers[index]:
+            self._record_score(index, 1.0)
+            self.user_answers[index] = user_answer
+            return 1.0, False, False
+        
+        # Correct answer forms are precomputed; only the user's answer needs normalizing
+        key = pair.answer_key(answer_field)
+        normalized_user = normalize_answer(user_answer)
         
-        # Also normalize WITH accents for accent-aware comparison (only for Greek)
-        is_greek_direction = has_greek and self.direction in [Direction.GREEK_TO_BULGARIAN, Direction.BULGARIAN_TO_GREEK]
+        # Accent-aware comparison (only for Greek)
+        is_greek_direction = self._accent_sensitive
         
         if is_greek_direction:
-            normalized_user_with_accents = WordRepository.normalize_with_accents(user_answer)
-            normalized_correct_with_accents = WordRepository.normalize_with_accents(correct_answer)
+            normalized_user_with_accents = normalize_with_accents(user_answer)
         
         score = 0.0
         is_partial_credit = False
         
-        # Determine if we're answering in Bulgarian (any variant acceptable) or foreign language (full answer required)
-        answering_in_bulgarian = False
-        if self.direction in [Direction.GREEK_TO_BULGARIAN, Direction.LATIN_TO_BULGARIAN, Direction.SPANISH_TO_BULGARIAN, Direction.LATIN_QA]:
-            answering_in_bulgarian = True
-        elif self.direction == Direction.LATIN_MIXED:
-            # Check actual_direction field
-            answering_in_bulgarian = (pair.actual_direction == Direction.LATIN_TO_BULGARIAN)
-        elif self.direction == Direction.SPANISH_MIXED:
-            answering_in_bulgarian = (pair.actual_direction == Direction.SPANISH_TO_BULGARIAN)
+        # Answering in Bulgarian (any variant acceptable) or foreign language (full answer required)
+        answering_in_bulgarian = answer_field == "bulgarian"
         
         # Check based on direction type
         if answering_in_bulgarian:
-            # Answering in Bulgarian - ANY ONE variant is acceptable
-            import re
-            
+            # Answering in Bulgarian - ANY ONE variant (or the whole answer) is acceptable
             if is_greek_direction:
-                # Greek: Check with accents first
-                if normalized_user_with_accents == normalized_correct_with_accents:
+                # Greek: Check with accents first, then WITHOUT accents for partial credit
+                if normalized_user_with_accents in key.variants_with_accents:
                     score = 1.0
-                else:
-                    # Split by comma OR semicolon
-                    variants_with_accents = re.split(r'[,;]\s*(?![^()]*\))', correct_answer)
-                    correct_variants_with_accents = [WordRepository.normalize_with_accents(v) for v in variants_with_accents]
-                    if normalized_user_with_accents in correct_variants_with_accents:
-                        score = 1.0
-                    # If not exact match, check WITHOUT accents
-                    elif normalized_user == normalized_correct:
-                        score = 0.5
-                        is_partial_credit = True
-                    else:
-                        variants = re.split(r'[,;]\s*(?![^()]*\))', correct_answer)
-                        correct_variants = [WordRepository.normalize_answer(v) for v in variants]
-                        if normalized_user in correct_variants:
-                            score = 0.5
-                            is_partial_credit = True
-                        else:
-                            score = 0.0
+                elif normalized_user in key.variants:
+                    score = 0.5
+                    is_partial_credit = True
             else:
                 # Latin/Spanish: No accent checking, just check variants
-                if normalized_user == normalized_correct:
+                if normalized_user in key.variants:
                     score = 1.0
-                else:
-                    variants = re.split(r'[,;]\s*(?![^()]*\))', correct_answer)
-                    correct_variants = [WordRepository.normalize_answer(v) for v in variants]
-                    if normalized_user in correct_variants:
-                        score = 1.0
-                    else:
-                        score = 0.0
         else:
             # Bulgarian → Greek/Latin - User must provide FULL answer
             if is_greek_direction:
-                if normalized_user_with_accents == normalized_correct_with_accents:
+                if normalized_user_with_accents == key.full_with_accents:
                     score = 1.0
-                elif normalized_user == normalized_correct:
+                elif normalized_user == key.full:
                     score = 0.5
                     is_partial_credit = True
-                else:
-                    score = 0.0
             else:
                 # Latin/Spanish: No accent checking
-                if normalized_user == normalized_correct:
+                if normalized_user == key.full:
                     score = 1.0
-                else:
-                    score = 0.0
         
-        self.answers[index] = score
+        self._record_score(index, score)
         self.user_answers[index] = user_answer
         
         return score, is_partial_credit, False
     
     def get_correct_answer(self, index: int) -> str:
         """Get the correct answer for a question"""
-        pair = self.word_pairs[index]
-        
-        # Auto-detect language based on which field is populated
-        has_greek = pair.greek is not None
-        has_latin = pair.latin is not None
-        has_spanish = pair.spanish is not None
-        
-        if self.direction in [Direction.GREEK_TO_BULGARIAN, Direction.LATIN_TO_BULGARIAN, Direction.SPANISH_TO_BULGARIAN, Direction.LATIN_QA]:
-            return pair.bulgarian
-        elif self.direction == Direction.BULGARIAN_TO_GREEK and has_greek:
-            return pair.greek
-        elif self.direction == Direction.BULGARIAN_TO_LATIN and has_latin:
-            return pair.latin
-        elif self.direction == Direction.BULGARIAN_TO_SPANISH and has_spanish:
-            return pair.spanish
-        elif self.direction == Direction.LATIN_MIXED and has_latin:
-            # Use actual_direction field
-            if pair.actual_direction == Direction.LATIN_TO_BULGARIAN:
-                return pair.bulgarian  # Latin -> Bulgarian
-            elif pair.actual_direction == Direction.BULGARIAN_TO_LATIN:
-                return pair.latin  # Bulgarian -> Latin
-            else:
-                # Fallback to index-based if actual_direction not set
-                if index % 2 == 0:
-                    return pair.bulgarian  # Latin -> Bulgarian
-                else:
-                    return pair.latin  # Bulgarian -> Latin
-        elif self.direction == Direction.SPANISH_MIXED and has_spanish:
-            if pair.actual_direction == Direction.SPANISH_TO_BULGARIAN:
-                return pair.bulgarian
-            elif pair.actual_direction == Direction.BULGARIAN_TO_SPANISH:
-                return pair.spanish
-            else:
-                if index % 2 == 0:
-                    return pair.bulgarian
-                else:
-                    return pair.spanish
-        
-        raise ValueError(f"Cannot determine correct answer for direction {self.direction}")
+        return self.correct_answers[index]
+    
+    def _answer_field(self, index: int) -> str:
+        """Name of the WordPair field holding the correct answer for a question"""
+        try:
+            return QUIZ_DIRECTIONS[self._pair_direction(index)][2]
+        except KeyError:
+            raise ValueError(f"Cannot determine correct answer for direction {self.direction}") from None
     
     def get_summary(self) -> QuizSummary:
         """Generate quiz summary"""
-        # Sum up scores (can be 0, 0.5, or 1.0 per answer)
-        total_score = sum(ans for ans in self.answers if ans is not None)
+        # Running sum of scores (can be 0, 0.5, or 1.0 per answer)
+        total_score = self.total_score
         total = len(self.word_pairs)
         score_percentage = (total_score / total * 100) if total > 0 else 0
         
         # Count fully correct answers (score = 1.0)
-        correct_count = sum(1 for ans in self.answers if ans == 1.0)
+        correct_count = self.answers.count(1.0)
         
         incorrect_words = []
         partial_credit_words = []
         
-        for i, (pair, score) in enumerate(zip(self.word_pairs, self.answers)):
-            # Auto-detect language based on which field is populated
-            has_greek = pair.greek is not None
-            has_latin = pair.latin is not None
-            has_spanish = pair.spanish is not None
-            
-            # Determine prompt and correct answer based on direction and available data
-            if self.direction == Direction.GREEK_TO_BULGARIAN and has_greek:
-                prompt = pair.greek
-                correct_ans = pair.bulgarian
-            elif self.direction == Direction.BULGARIAN_TO_GREEK and has_greek:
-                prompt = pair.bulgarian
-                correct_ans = pair.greek
-            elif self.direction == Direction.LATIN_TO_BULGARIAN and has_latin:
-                prompt = pair.latin
-                correct_ans = pair.bulgarian
-            elif self.direction == Direction.LATIN_QA and has_latin:
-                prompt = pair.latin
-                correct_ans = pair.bulgarian
-            elif self.direction == Direction.BULGARIAN_TO_LATIN and has_latin:
-                prompt = pair.bulgarian
-                correct_ans = pair.latin
-            elif self.direction == Direction.LATIN_MIXED and has_latin:
-                if pair.actual_direction == Direction.LATIN_TO_BULGARIAN:
-                    prompt = pair.latin
-                    correct_ans = pair.bulgarian
-                elif pair.actual_direction == Direction.BULGARIAN_TO_LATIN:
-                    prompt = pair.bulgarian
-                    correct_ans = pair.latin
-                else:
-                    if i % 2 == 0:
-                        prompt = pair.latin
-                        correct_ans = pair.bulgarian
-                    else:
-                        prompt = pair.bulgarian
-                        correct_ans = pair.latin
-            elif self.direction == Direction.SPANISH_TO_BULGARIAN and has_spanish:
-                prompt = pair.spanish
-                correct_ans = pair.bulgarian
-            elif self.direction == Direction.BULGARIAN_TO_SPANISH and has_spanish:
-                prompt = pair.bulgarian
-                correct_ans = pair.spanish
-            elif self.direction == Direction.SPANISH_MIXED and has_spanish:
-                if pair.actual_direction == Direction.SPANISH_TO_BULGARIAN:
-                    prompt = pair.spanish
-                    correct_ans = pair.bulgarian
-                elif pair.actual_direction == Direction.BULGARIAN_TO_SPANISH:
-                    prompt = pair.bulgarian
-                    correct_ans = pair.spanish
-                else:
-                    if i % 2 == 0:
-                        prompt = pair.spanish
-                        correct_ans = pair.bulgarian
-                    else:
-                        prompt = pair.bulgarian
-                        correct_ans = pair.spanish
-            
-            word_info = {
-                "prompt": prompt,
-                "correct_answer": correct_ans,
-                "user_answer": self.user_answers[i]
-            }
-            
+        # Prompts and correct answers were resolved per question in __init__, so no direction checks here
+        for i, score in enumerate(self.answers):
             if score == 0.0:
-                incorrect_words.append(word_info)
+                target = incorrect_words
             elif score == 0.5:
-                partial_credit_words.append(word_info)
+                target = partial_credit_words
+            else:
+                continue
+            target.append({
+                "prompt": self.questions[i]["prompt"],
+                "correct_answer": self.correct_answers[i],
+                "user_answer": self.user_answers[i]
+            })
         
         return QuizSummary(
             session_id=self.session_id,
@@ -1712,50 +1712,92 @@ class QuizSession:
         )
 
 
+SESSION_IDLE_TTL_SECONDS = 4 * 60 * 60  # Sessions untouched for this long are dropped
+MAX_SESSIONS = 10_000  # Least recently used sessions are dropped beyond this
+
+
 class SessionManager:
-    """Manages multiple quiz sessions"""
+    """Manages multiple quiz sessions (LRU-ordered, idle sessions expire so memory stays bounded)"""
+    
+    def __init__(self, ttl_seconds: float = SESSION_IDLE_TTL_SECONDS, max_sessions: int = MAX_SESSIONS):
+        self.sessions: "OrderedDict[str, Any]" = OrderedDict()  # Least recently used first
+        self._last_access: Dict[str, float] = {}
+        self._lock = threading.Lock()  # Endpoints run in FastAPI's threadpool
+        self.ttl_seconds = ttl_seconds
+        self.max_sessions = max_sessions
+    
+    def _add(self, session: Any):
+        """Register a new session and evict expired / excess ones"""
+        with self._lock:
+            self.sessions[session.session_id] = session
+            self._last_access[session.session_id] = time.monotonic()
+            self._evict()
     
-    def __init__(self):
-        self.sessions: Dict[str, Any] = {}
+    def _evict(self):
+        """Drop sessions idle for longer than the TTL, then the oldest ones above max_sessions (caller holds the lock)"""
+        cutoff = time.monotonic() - self.ttl_seconds
+        while self.sessions:
+            oldest_id = next(iter(self.sessions))
+            if self._last_access[oldest_id] > cutoff and len(self.sessions) <= self.max_sessions:
+                break
+            del self.sessions[oldest_id]
+            del self._last_access[oldest_id]
     
     def create_session(self, word_pairs: List[WordPair], direction: str, time_per_question: int = 60) -> QuizSession:
         """Create a new vocabulary quiz session"""
-        session_id = str(uuid4())
+        session_id = new_session_id()
         session = QuizSession(session_id, word_pairs, direction, time_per_question)
-        self.sessions[session_id] = session
+        self._add(session)
         return session
 
     def create_literature_session(self, topic_id: str, questions: List[LiteratureQuestion], direction: str,
                                   time_per_question: int, grader: LiteratureOpenAIGrader,
                                   no_time_limit_open: bool = False) -> LiteratureSession:
         """Create a new literature session"""
-        session_id = str(uuid4())
+        session_id = new_session_id()
         session = LiteratureSession(session_id, topic_id, questions, direction, time_per_question, grader, no_time_limit_open=no_time_limit_open)
-        self.sessions[session_id] = session
+        self._add(session)
         return session
 
     def create_verse_session(self, lesson: float, groups: List[VerseGroup],
                              time_per_question: int, grader: VerseTranslationGrader) -> VerseTranslationSession:
         """Create a new verse translation session"""
-        session_id = str(uuid4())
+        session_id = new_session_id()
         session = VerseTranslationSession(session_id, lesson, groups, time_per_question, grader)
-        self.sessions[session_id] = session
+        self._add(session)
         return session
     
     def get_session(self, session_id: str) -> Any:
         """Retrieve a session by ID"""
-        if session_id not in self.sessions:
-            raise HTTPException(status_code=404, detail="Session not found")
-        return self.sessions[session_id]
+        with self._lock:
+            self._evict()
+            if session_id not in self.sessions:
+                raise HTTPException(status_code=404, detail="Session not found")
+            self.sessions.move_to_end(session_id)
+            self._last_access[session_id] = time.monotonic()
+            return self.sessions[session_id]
     
     def delete_session(self, session_id: str):
         """Delete a session"""
-        if session_id in self.sessions:
-            del self.sessions[session_id]
+        with self._lock:
+            if session_id in self.sessions:
+                del self.sessions[session_id]
+                del self._last_access[session_id]
 
 
 # ==================== FastAPI App ====================
 
+class JSONBytesResponse(JSONResponse):
+    """JSONResponse rendered with dump_json_bytes (orjson when available).
+
+    Used on routes that return plain dicts. Routes with a response_model keep the
+    default class, which lets FastAPI serialize the model straight to bytes.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return dump_json_bytes(content)
+
+
 app = FastAPI(
     title="Language Trainer (Ancient Greek, Latin & Spanish)",
     description="Vocabulary quiz API for Ancient Greek, Latin and Spanish - Bulgarian",
@@ -1791,10 +1833,22 @@ session_manager = SessionManager()
 
 # ==================== Endpoints ====================
 
+# language_mode -> serialized /api/config response. The repositories don't change after startup.
+_config_response_cache: Dict[str, bytes] = {}
+
+
 @app.get("/api/config")
-async def get_config(language_mode: str = LanguageMode.GREEK):
+def get_config(language_mode: str = LanguageMode.GREEK):
     """Get available configuration options based on language mode"""
-    
+    body = _config_response_cache.get(language_mode)
+    if body is None:
+        body = dump_json_bytes(_build_config_payload(language_mode))
+        _config_response_cache[language_mode] = body
+    return Response(content=body, media_type="application/json")
+
+
+def _build_config_payload(language_mode: str) -> Dict[str, Any]:
+    """Build the /api/config payload for a language mode"""
     if language_mode == LanguageMode.GREEK:
         available_lessons = word_repo.get_available_lessons()
         total_words = len(word_repo.greek_words)
@@ -1927,23 +1981,43 @@ async def get_config(language_mode: str = LanguageMode.GREEK):
     return payload
 
 
-@app.post("/api/words-count")
-async def get_words_count(request: Dict):
+def _lesson_selection(request: Dict) -> frozenset:
+    """selected_lessons from a raw request body as a frozenset (400 unless it is a list of lesson numbers)"""
+    selected_lessons = request.get("selected_lessons") or []
+    if not isinstance(selected_lessons, list) or not all(
+        isinstance(lesson, (int, float)) and not isinstance(lesson, bool) for lesson in selected_lessons
+    ):
+        raise HTTPException(status_code=400, detail="selected_lessons must be a list of lesson numbers")
+    return frozenset(selected_lessons)
+
+
+def _count_lesson_words(language_mode: str, direction: Optional[str], lessons: frozenset) -> int:
+    """Number of words in the selected lessons (the lesson selection itself is cached by WordRepository)"""
+    if language_mode == LanguageMode.GREEK:
+        return len(word_repo.get_words_by_lessons(lessons))
+    if language_mode == LanguageMode.LATIN:
+        return len(word_repo.get_latin_words_by_lessons(lessons, direction))
+    return len(word_repo.get_spanish_words_by_lessons(lessons))
+
+
+@app.post("/api/words-count", response_class=JSONBytesResponse)
+def get_words_count(request: Dict):
     """Get word count for selected lessons or language mode"""
     language_mode = request.get("language_mode", LanguageMode.GREEK)
     
     if language_mode == LanguageMode.GREEK:
-        selected_lessons = request.get("selected_lessons", [])
-        if selected_lessons is None or len(selected_lessons) == 0:
+        selected_lessons = _lesson_selection(request)
+        if len(selected_lessons) == 0:
             return {"count": 0}
-        words = word_repo.get_words_by_lessons(selected_lessons)
-        return {"count": len(words)}
+        return {"count": _count_lesson_words(language_mode, None, selected_lessons)}
     elif language_mode == LanguageMode.LATIN:
-        selected_lessons = request.get("selected_lessons", [])
+        selected_lessons = _lesson_selection(request)
         direction = request.get("direction", Direction.LATIN_TO_BULGARIAN)
+        if not isinstance(direction, str):
+            raise HTTPException(status_code=400, detail="direction must be a string")
         if selected_lessons:
-            words = word_repo.get_latin_words_by_lessons(selected_lessons, direction if direction != Direction.LATIN_MIXED else None)
-            return {"count": len(words)}
+            lesson_direction = direction if direction != Direction.LATIN_MIXED else None
+            return {"count": _count_lesson_words(language_mode, lesson_direction, selected_lessons)}
         if direction == Direction.LATIN_MIXED:
             # For mixed mode, return combined count from both directions
             count = len(word_repo.latin_la_bg) + len(word_repo.latin_bg_la)
@@ -1954,11 +2028,10 @@ async def get_words_count(request: Dict):
     elif language_mode == LanguageMode.SPANISH:
         # Lesson-based Spanish (preferred)
         if len(word_repo.spanish_words) > 0:
-            selected_lessons = request.get("selected_lessons", [])
-            if selected_lessons is None or len(selected_lessons) == 0:
+            selected_lessons = _lesson_selection(request)
+            if len(selected_lessons) == 0:
                 return {"count": 0}
-            words = word_repo.get_spanish_words_by_lessons(selected_lessons)
-            return {"count": len(words)}
+            return {"count": _count_lesson_words(language_mode, None, selected_lessons)}
 
         # Legacy phrase mode (no lessons)
         direction = request.get("direction", Direction.SPANISH_TO_BULGARIAN)
@@ -1998,8 +2071,8 @@ async def get_words_count(request: Dict):
 
 # ==================== Verse Translation Endpoints ====================
 
-@app.get("/api/verse-config")
-async def get_verse_config():
+@app.get("/api/verse-config", response_class=JSONBytesResponse)
+def get_verse_config():
     """Return list of verse-eligible lessons and their metadata."""
     lessons = word_repo.verse_lessons_config
     result = []
@@ -2016,8 +2089,8 @@ async def get_verse_config():
     return {"verse_lessons": result}
 
 
-@app.post("/api/verse-quiz")
-async def start_verse_quiz(request: Dict):
+@app.post("/api/verse-quiz", response_class=JSONBytesResponse)
+def start_verse_quiz(request: Dict):
     """Create a verse translation session.
 
     Expected body:
@@ -2120,10 +2193,52 @@ async def start_verse_quiz(request: Dict):
     }
 
 
+def _sample_mixed_pairs(config: QuizConfig, answered: frozenset, field: str, halves) -> List[WordPair]:
+    """Build a two-list mixed quiz (Latin phrases, legacy Spanish phrases), interleaving the two directions.
+
+    halves holds two (words, full_words, direction) tuples; a list emptied by the exclusion filter
+    restarts from full_words. Each sampled pair is a copy tagged with its actual_direction.
+    """
+    sampled = []
+    for half, (words, full_words, direction) in enumerate(halves):
+        if answered:
+            words = WordRepository.drop_answered(words, field, answered)
+            logger.debug("After exclusion: %d %s words available", len(words), direction)
+        if len(words) == 0:
+            words = full_words
+            logger.info("All %s words mastered! Restarting with full set: %d words", direction, len(words))
+        
+        if config.use_all_words:
+            count = len(words)
+        else:
+            # Split the requested count evenly; the second direction takes the odd one
+            count = config.count // 2 if half == 0 else config.count - config.count // 2
+        
+        if config.random_order:
+            picked = random.sample(words, min(count, len(words)))
+        else:
+            picked = words[:count]
+        # Copy rather than mutate (the pairs are shared with the repository) so the frontend knows how to save progress
+        sampled.append([dataclasses.replace(wp, actual_direction=direction) for wp in picked])
+    
+    # Interleave the two lists: first, second, first, second, ...
+    first, second = sampled
+    word_pairs = []
+    for i in range(max(len(first), len(second))):
+        if i < len(first):
+            word_pairs.append(first[i])
+        if i < len(second):
+            word_pairs.append(second[i])
+    
+    logger.debug("Mixed mode: %d + %d = %d total", len(first), len(second), len(word_pairs))
+    return word_pairs
+
+
 @app.post("/api/quiz", response_model=QuizStartResponse)
-async def start_quiz(config: QuizConfig):
+def start_quiz(config: QuizConfig):
     """Start a new quiz session"""
-    print(f"[{get_timestamp()}] [DEBUG] Received config: {config.model_dump()}")
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Received config: %s", config.model_dump())
     
     # Validate direction
     valid_directions = [
@@ -2146,11 +2261,11 @@ async def start_quiz(config: QuizConfig):
         # Reuse question ids (exam after training)
         if config.word_pairs:
             if not topic_id:
-                topic_id = config.word_pairs[0].get("topic_id")
+                topic_id = config.word_pairs[0].topic_id
             if not topic_id:
                 raise HTTPException(status_code=400, detail="topic_id is required for literature")
 
-            question_ids = [wp.get("question_id") for wp in config.word_pairs if wp.get("question_id")]
+            question_ids = [wp.question_id for wp in config.word_pairs if wp.question_id]
             if not question_ids:
                 raise HTTPException(status_code=400, detail="No question_id provided")
 
@@ -2166,15 +2281,15 @@ async def start_quiz(config: QuizConfig):
             # Exclude mastered
             if config.exclude_correct_words:
                 exclude_ids = {
-                    wp.get("question_id")
+                    wp.question_id
                     for wp in config.exclude_correct_words
-                    if wp.get("question_id")
+                    if wp.question_id
                 }
                 available_questions = [q for q in available_questions if q.id not in exclude_ids]
 
             if len(available_questions) == 0:
                 available_questions = literature_repo.get_questions(topic_id)
-                print(f"[{get_timestamp()}] [INFO] All questions mastered! Restarting with full question set: {len(available_questions)}")
+                logger.info("All questions mastered! Restarting with full question set: %d", len(available_questions))
 
             if config.use_all_words:
                 selected_questions = list(available_questions)
@@ -2194,11 +2309,10 @@ async def start_quiz(config: QuizConfig):
             no_time_limit_open=config.no_time_limit_open,
         )
 
-        print(f"\n[{get_timestamp()}] [DEBUG] Literature Quiz Started:")
-        print(f"[{get_timestamp()}]   Session ID: {session.session_id}")
-        print(f"[{get_timestamp()}]   Topic: {topic_id}")
-        print(f"[{get_timestamp()}]   Questions: {len(selected_questions)}")
-        print(f"[{get_timestamp()}]   Time per Question: {config.time_per_question}s\n")
+        logger.debug(
+            "Literature Quiz Started:\n  Session ID: %s\n  Topic: %s\n  Questions: %d\n  Time per Question: %ss",
+            session.session_id, topic_id, len(selected_questions), config.time_per_question,
+        )
 
         session.start_question(0)
 
@@ -2226,11 +2340,11 @@ async def start_quiz(config: QuizConfig):
 
         if config.word_pairs:
             if not topic_id:
-                topic_id = config.word_pairs[0].get("topic_id")
+                topic_id = config.word_pairs[0].topic_id
             if not topic_id:
                 raise HTTPException(status_code=400, detail="topic_id is required for biology")
 
-            question_ids = [wp.get("question_id") for wp in config.word_pairs if wp.get("question_id")]
+            question_ids = [wp.question_id for wp in config.word_pairs if wp.question_id]
             if not question_ids:
                 raise HTTPException(status_code=400, detail="No question_id provided")
 
@@ -2245,15 +2359,15 @@ async def start_quiz(config: QuizConfig):
 
             if config.exclude_correct_words:
                 exclude_ids = {
-                    wp.get("question_id")
+                    wp.question_id
                     for wp in config.exclude_correct_words
-                    if wp.get("question_id")
+                    if wp.question_id
                 }
                 available_questions = [q for q in available_questions if q.id not in exclude_ids]
 
             if len(available_questions) == 0:
                 available_questions = biology_repo.get_questions(topic_id)
-                print(f"[{get_timestamp()}] [INFO] All biology questions mastered! Restarting with full set: {len(available_questions)}")
+                logger.info("All biology questions mastered! Restarting with full set: %d", len(available_questions))
 
             if config.use_all_words:
                 selected_questions = list(available_questions)
@@ -2273,14 +2387,14 @@ async def start_quiz(config: QuizConfig):
             no_time_limit_open=config.no_time_limit_open,
         )
 
-        ids_selected = [q.id for q in selected_questions]
-        print(f"\n[{get_timestamp()}] [DEBUG] Biology Quiz Started:")
-        print(f"[{get_timestamp()}]   Session ID: {session.session_id}")
-        print(f"[{get_timestamp()}]   Topic: {topic_id}")
-        print(f"[{get_timestamp()}]   Questions: {len(selected_questions)} | IDs: {ids_selected}")
-        if len(ids_selected) != len(set(ids_selected)):
-            print(f"[{get_timestamp()}]   *** DUPLICATE QUESTION IDs DETECTED ***")
-        print(f"[{get_timestamp()}]   Time per Question: {config.time_per_question}s\n")
+        if logger.isEnabledFor(logging.DEBUG):
+            ids_selected = [q.id for q in selected_questions]
+            logger.debug(
+                "Biology Quiz Started:\n  Session ID: %s\n  Topic: %s\n  Questions: %d | IDs: %s\n  Time per Question: %ss",
+                session.session_id, topic_id, len(selected_questions), ids_selected, config.time_per_question,
+            )
+            if len(ids_selected) != len(set(ids_selected)):
+                logger.debug("  *** DUPLICATE QUESTION IDs DETECTED ***")
 
         session.start_question(0)
 
@@ -2308,11 +2422,11 @@ async def start_quiz(config: QuizConfig):
 
         if config.word_pairs:
             if not topic_id:
-                topic_id = config.word_pairs[0].get("topic_id")
+                topic_id = config.word_pairs[0].topic_id
             if not topic_id:
                 raise HTTPException(status_code=400, detail="topic_id is required for history")
 
-            question_ids = [wp.get("question_id") for wp in config.word_pairs if wp.get("question_id")]
+            question_ids = [wp.question_id for wp in config.word_pairs if wp.question_id]
             if not question_ids:
                 raise HTTPException(status_code=400, detail="No question_id provided")
 
@@ -2327,15 +2441,15 @@ async def start_quiz(config: QuizConfig):
 
             if config.exclude_correct_words:
                 exclude_ids = {
-                    wp.get("question_id")
+                    wp.question_id
                     for wp in config.exclude_correct_words
-                    if wp.get("question_id")
+                    if wp.question_id
                 }
                 available_questions = [q for q in available_questions if q.id not in exclude_ids]
 
             if len(available_questions) == 0:
                 available_questions = history_repo.get_questions(topic_id)
-                print(f"[{get_timestamp()}] [INFO] All history questions mastered! Restarting with full set: {len(available_questions)}")
+                logger.info("All history questions mastered! Restarting with full set: %d", len(available_questions))
 
             if config.use_all_words:
                 selected_questions = list(available_questions)
@@ -2355,11 +2469,11 @@ async def start_quiz(config: QuizConfig):
             no_time_limit_open=config.no_time_limit_open,
         )
 
-        ids_selected = [q.id for q in selected_questions]
-        print(f"\n[{get_timestamp()}] [DEBUG] History Quiz Started:")
-        print(f"[{get_timestamp()}]   Session ID: {session.session_id}")
-        print(f"[{get_timestamp()}]   Topic: {topic_id}")
-        print(f"[{get_timestamp()}]   Questions: {len(selected_questions)} | IDs: {ids_selected}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "History Quiz Started:\n  Session ID: %s\n  Topic: %s\n  Questions: %d | IDs: %s",
+                session.session_id, topic_id, len(selected_questions), [q.id for q in selected_questions],
+            )
 
         session.start_question(0)
 
@@ -2387,11 +2501,11 @@ async def start_quiz(config: QuizConfig):
 
         if config.word_pairs:
             if not topic_id:
-                topic_id = config.word_pairs[0].get("topic_id")
+                topic_id = config.word_pairs[0].topic_id
             if not topic_id:
                 raise HTTPException(status_code=400, detail="topic_id is required for geography")
 
-            question_ids = [wp.get("question_id") for wp in config.word_pairs if wp.get("question_id")]
+            question_ids = [wp.question_id for wp in config.word_pairs if wp.question_id]
             if not question_ids:
                 raise HTTPException(status_code=400, detail="No question_id provided")
 
@@ -2406,15 +2520,15 @@ async def start_quiz(config: QuizConfig):
 
             if config.exclude_correct_words:
                 exclude_ids = {
-                    wp.get("question_id")
+                    wp.question_id
                     for wp in config.exclude_correct_words
-                    if wp.get("question_id")
+                    if wp.question_id
                 }
                 available_questions = [q for q in available_questions if q.id not in exclude_ids]
 
             if len(available_questions) == 0:
                 available_questions = geography_repo.get_questions(topic_id)
-                print(f"[{get_timestamp()}] [INFO] All geography questions mastered! Restarting with full set: {len(available_questions)}")
+                logger.info("All geography questions mastered! Restarting with full set: %d", len(available_questions))
 
             if config.use_all_words:
                 selected_questions = list(available_questions)
@@ -2434,11 +2548,11 @@ async def start_quiz(config: QuizConfig):
             no_time_limit_open=config.no_time_limit_open,
         )
 
-        ids_selected = [q.id for q in selected_questions]
-        print(f"\n[{get_timestamp()}] [DEBUG] Geography Quiz Started:")
-        print(f"[{get_timestamp()}]   Session ID: {session.session_id}")
-        print(f"[{get_timestamp()}]   Topic: {topic_id}")
-        print(f"[{get_timestamp()}]   Questions: {len(selected_questions)} | IDs: {ids_selected}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "Geography Quiz Started:\n  Session ID: %s\n  Topic: %s\n  Questions: %d | IDs: %s",
+                session.session_id, topic_id, len(selected_questions), [q.id for q in selected_questions],
+            )
 
         session.start_question(0)
 
@@ -2466,11 +2580,11 @@ async def start_quiz(config: QuizConfig):
 
         if config.word_pairs:
             if not topic_id:
-                topic_id = config.word_pairs[0].get("topic_id")
+                topic_id = config.word_pairs[0].topic_id
             if not topic_id:
                 raise HTTPException(status_code=400, detail="topic_id is required for chemistry")
 
-            question_ids = [wp.get("question_id") for wp in config.word_pairs if wp.get("question_id")]
+            question_ids = [wp.question_id for wp in config.word_pairs if wp.question_id]
             if not question_ids:
                 raise HTTPException(status_code=400, detail="No question_id provided")
 
@@ -2485,15 +2599,15 @@ async def start_quiz(config: QuizConfig):
 
             if config.exclude_correct_words:
                 exclude_ids = {
-                    wp.get("question_id")
+                    wp.question_id
                     for wp in config.exclude_correct_words
-                    if wp.get("question_id")
+                    if wp.question_id
                 }
                 available_questions = [q for q in available_questions if q.id not in exclude_ids]
 
             if len(available_questions) == 0:
                 available_questions = chemistry_repo.get_questions(topic_id)
-                print(f"[{get_timestamp()}] [INFO] All chemistry questions mastered! Restarting with full set: {len(available_questions)}")
+                logger.info("All chemistry questions mastered! Restarting with full set: %d", len(available_questions))
 
             if config.use_all_words:
                 selected_questions = list(available_questions)
@@ -2513,11 +2627,11 @@ async def start_quiz(config: QuizConfig):
             no_time_limit_open=config.no_time_limit_open,
         )
 
-        ids_selected = [q.id for q in selected_questions]
-        print(f"\n[{get_timestamp()}] [DEBUG] Chemistry Quiz Started:")
-        print(f"[{get_timestamp()}]   Session ID: {session.session_id}")
-        print(f"[{get_timestamp()}]   Topic: {topic_id}")
-        print(f"[{get_timestamp()}]   Questions: {len(selected_questions)} | IDs: {ids_selected}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "Chemistry Quiz Started:\n  Session ID: %s\n  Topic: %s\n  Questions: %d | IDs: %s",
+                session.session_id, topic_id, len(selected_questions), [q.id for q in selected_questions],
+            )
 
         session.start_question(0)
 
@@ -2536,90 +2650,66 @@ async def start_quiz(config: QuizConfig):
             word_pairs=word_pairs_dict,
         )
 
+    # WordPair field holding the foreign-language side for this vocabulary mode
+    language_field = config.language_mode if config.language_mode in (LanguageMode.GREEK, LanguageMode.LATIN) else "spanish"
+
     # Get word pairs - either from config (reusing) or randomly selected
     if config.word_pairs:
-        # Reuse specific word pairs (for exam after training)
+        # Reuse specific word pairs (for exam after training); both sides are needed to ask and grade each one
+        malformed = [i for i, wp in enumerate(config.word_pairs) if not wp.bulgarian or not getattr(wp, language_field)]
+        if malformed:
+            raise HTTPException(
+                status_code=400,
+                detail=f"word_pairs entries missing '{language_field}' or 'bulgarian': {malformed}",
+            )
         word_pairs = []
         for wp in config.word_pairs:
             if config.language_mode == LanguageMode.GREEK:
                 word_pairs.append(WordPair(
-                    greek=wp.get("greek"), 
-                    bulgarian=wp["bulgarian"],
-                    lesson=wp.get("lesson")
+                    greek=wp.greek, 
+                    bulgarian=wp.bulgarian,
+                    lesson=wp.lesson
                 ))
             elif config.language_mode == LanguageMode.LATIN:
                 word_pairs.append(WordPair(
-                    latin=wp.get("latin"),
-                    bulgarian=wp["bulgarian"],
-                    lesson=wp.get("lesson")
+                    latin=wp.latin,
+                    bulgarian=wp.bulgarian,
+                    lesson=wp.lesson
                 ))
             else:  # Spanish
                 word_pairs.append(WordPair(
-                    spanish=wp.get("spanish"),
-                    bulgarian=wp["bulgarian"],
-                    lesson=wp.get("lesson")
+                    spanish=wp.spanish,
+                    bulgarian=wp.bulgarian,
+                    lesson=wp.lesson
                 ))
         # Shuffle the word pairs to present them in a different order than training (if random order is enabled)
         if config.random_order:
             random.shuffle(word_pairs)
     else:
-        # Get all available words based on language mode
-        if config.language_mode == LanguageMode.GREEK:
+        # Words already answered correctly, keyed once for every list filtered below
+        answered = WordRepository.answered_keys(language_field, config.exclude_correct_words or [])
+        
+        if config.language_mode == LanguageMode.LATIN and config.direction == Direction.LATIN_MIXED:
+            # Latin mixed mode keeps the la→bg and bg→la phrases in separate lists
             if config.selected_lessons:
-                available_words = word_repo.get_words_by_lessons(config.selected_lessons)
-            else:
-                available_words = word_repo.greek_words
-        elif config.language_mode == LanguageMode.LATIN:
-            # For mixed mode, we need to handle word selection differently
-            if config.direction == Direction.LATIN_MIXED:
-                available_words = None  # handled later
-            elif config.selected_lessons:
-                available_words = word_repo.get_latin_words_by_lessons(config.selected_lessons, config.direction)
-            else:
-                available_words = word_repo.get_words_for_language_and_direction(config.language_mode, config.direction)
-        else:  # Spanish
-            # Preferred: lesson-based Spanish (single list, like Greek)
-            if len(word_repo.spanish_words) > 0:
-                if config.selected_lessons:
-                    available_words = word_repo.get_spanish_words_by_lessons(config.selected_lessons)
-                else:
-                    available_words = word_repo.spanish_words
+                la_bg_words = word_repo.get_latin_words_by_lessons(config.selected_lessons, Direction.LATIN_TO_BULGARIAN)
+                bg_la_words = word_repo.get_latin_words_by_lessons(config.selected_lessons, Direction.BULGARIAN_TO_LATIN)
             else:
-                # Legacy fallback: phrase files
-                if config.direction == Direction.SPANISH_MIXED:
-                    available_words = None  # handled later (legacy)
-                else:
-                    available_words = word_repo.get_words_for_language_and_direction(config.language_mode, config.direction)
-        
-        # Filter out words that were already answered correctly
-        if config.exclude_correct_words and available_words is not None:
-            print(f"[{get_timestamp()}] [DEBUG] Excluding {len(config.exclude_correct_words)} correct words")
-            
-            if config.language_mode == LanguageMode.GREEK:
-                exclude_set = {
-                    (wp.get("greek"), wp["bulgarian"]) 
-                    for wp in config.exclude_correct_words
-                }
-                available_words = [
-                    wp for wp in available_words 
-                    if (wp.greek, wp.bulgarian) not in exclude_set
-                ]
-            elif config.language_mode == LanguageMode.LATIN:
-                exclude_set = {
-                    (wp.get("latin"), wp["bulgarian"]) 
-                    for wp in config.exclude_correct_words
-                }
-                available_words = [wp for wp in available_words if (wp.latin, wp.bulgarian) not in exclude_set]
-            else:  # Spanish
-                exclude_set = {
-                    (wp.get("spanish"), wp["bulgarian"]) 
-                    for wp in config.exclude_correct_words
-                }
-                available_words = [wp for wp in available_words if (wp.spanish, wp.bulgarian) not in exclude_set]
-            print(f"[{get_timestamp()}] [DEBUG] After exclusion: {len(available_words)} words available")
-        
-        # If all words have been mastered (filtered everything out), restart the cycle with all words
-        if available_words is not None and len(available_words) == 0:
+                la_bg_words = word_repo.latin_la_bg
+                bg_la_words = word_repo.latin_bg_la
+            word_pairs = _sample_mixed_pairs(config, answered, "latin", (
+                (la_bg_words, word_repo.latin_la_bg, Direction.LATIN_TO_BULGARIAN),
+                (bg_la_words, word_repo.latin_bg_la, Direction.BULGARIAN_TO_LATIN),
+            ))
+        elif (config.language_mode == LanguageMode.SPANISH and config.direction == Direction.SPANISH_MIXED
+              and len(word_repo.spanish_words) == 0):
+            # Legacy Spanish mixed mode: interleave the two phrase files (no lessons)
+            word_pairs = _sample_mixed_pairs(config, answered, "spanish", (
+                (word_repo.spanish_es_bg, word_repo.spanish_es_bg, Direction.SPANISH_TO_BULGARIAN),
+                (word_repo.spanish_bg_es, word_repo.spanish_bg_es, Direction.BULGARIAN_TO_SPANISH),
+            ))
+        else:
+            # Every other mode draws from a single list
             if config.language_mode == LanguageMode.GREEK:
                 if config.selected_lessons:
                     available_words = word_repo.get_words_by_lessons(config.selected_lessons)
@@ -2630,87 +2720,30 @@ async def start_quiz(config: QuizConfig):
                     available_words = word_repo.get_latin_words_by_lessons(config.selected_lessons, config.direction)
                 else:
                     available_words = word_repo.get_words_for_language_and_direction(config.language_mode, config.direction)
-            elif config.language_mode == LanguageMode.SPANISH and len(word_repo.spanish_words) > 0:
+            elif len(word_repo.spanish_words) > 0:
+                # Preferred: lesson-based Spanish (single list, like Greek)
                 if config.selected_lessons:
                     available_words = word_repo.get_spanish_words_by_lessons(config.selected_lessons)
                 else:
                     available_words = word_repo.spanish_words
             else:
+                # Legacy fallback: phrase files
                 available_words = word_repo.get_words_for_language_and_direction(config.language_mode, config.direction)
-            print(f"[{get_timestamp()}] [INFO] All words mastered! Restarting with full word set: {len(available_words)} words")
-        
-        # Special handling for Latin mixed mode
-        if config.language_mode == LanguageMode.LATIN and config.direction == Direction.LATIN_MIXED:
-            # Get words from both directions separately
-            if config.selected_lessons:
-                la_bg_words = word_repo.get_latin_words_by_lessons(config.selected_lessons, Direction.LATIN_TO_BULGARIAN)
-                bg_la_words = word_repo.get_latin_words_by_lessons(config.selected_lessons, Direction.BULGARIAN_TO_LATIN)
-            else:
-                la_bg_words = word_repo.latin_la_bg
-                bg_la_words = word_repo.latin_bg_la
             
-            # Filter out correctly answered words if requested
-            if config.exclude_correct_words:
-                print(f"[{get_timestamp()}] [DEBUG] Excluding {len(config.exclude_correct_words)} correct words from mixed mode")
-                exclude_set = {
-                    (wp.get("latin"), wp["bulgarian"]) 
-                    for wp in config.exclude_correct_words
-                }
-                la_bg_words = [
-                    wp for wp in la_bg_words 
-                    if (wp.latin, wp.bulgarian) not in exclude_set
-                ]
-                bg_la_words = [
-                    wp for wp in bg_la_words 
-                    if (wp.latin, wp.bulgarian) not in exclude_set
-                ]
-                print(f"[{get_timestamp()}] [DEBUG] After exclusion: {len(la_bg_words)} la→bg, {len(bg_la_words)} bg→la available")
-            
-            # If all words mastered in one or both directions, restart with full lists
-            if len(la_bg_words) == 0:
-                la_bg_words = word_repo.latin_la_bg
-                print(f"[{get_timestamp()}] [INFO] All la→bg words mastered! Restarting with full set: {len(la_bg_words)} words")
-            if len(bg_la_words) == 0:
-                bg_la_words = word_repo.latin_bg_la
-                print(f"[{get_timestamp()}] [INFO] All bg→la words mastered! Restarting with full set: {len(bg_la_words)} words")
-            
-            # Determine how many words we need from each direction
-            if config.use_all_words:
-                # Use all words from both lists, interleaved
-                count_la_bg = len(la_bg_words)
-                count_bg_la = len(bg_la_words)
-            else:
-                # Split the requested count evenly between both directions
-                count_la_bg = config.count // 2
-                count_bg_la = config.count - count_la_bg  # Remaining (handles odd numbers)
-            
-            # Sample from each list - random or sequential based on config
-            if config.random_order:
-                sampled_la_bg = random.sample(la_bg_words, min(count_la_bg, len(la_bg_words)))
-                sampled_bg_la = random.sample(bg_la_words, min(count_bg_la, len(bg_la_words)))
-            else:
-                sampled_la_bg = la_bg_words[:count_la_bg]
-                sampled_bg_la = bg_la_words[:count_bg_la]
+            # Filter out words that were already answered correctly (keeping the full list for a restart)
+            unfiltered_words = available_words
+            if answered:
+                logger.debug("Excluding %d correct words", len(config.exclude_correct_words))
+                available_words = WordRepository.drop_answered(available_words, language_field, answered)
+                logger.debug("After exclusion: %d words available", len(available_words))
             
-            # Interleave the two lists: la→bg, bg→la, la→bg, bg→la, ...
-            # Mark each word with its actual direction so frontend knows how to save progress
-            word_pairs = []
-            max_len = max(len(sampled_la_bg), len(sampled_bg_la))
-            for i in range(max_len):
-                if i < len(sampled_la_bg):
-                    wp = sampled_la_bg[i].model_copy()
-                    wp.actual_direction = Direction.LATIN_TO_BULGARIAN
-                    word_pairs.append(wp)
-                if i < len(sampled_bg_la):
-                    wp = sampled_bg_la[i].model_copy()
-                    wp.actual_direction = Direction.BULGARIAN_TO_LATIN
-                    word_pairs.append(wp)
+            # If all words have been mastered (filtered everything out), restart the cycle with all words
+            if len(available_words) == 0:
+                available_words = unfiltered_words
+                logger.info("All words mastered! Restarting with full word set: %d words", len(available_words))
             
-            print(f"[{get_timestamp()}] [DEBUG] Mixed mode: {len(sampled_la_bg)} la→bg + {len(sampled_bg_la)} bg→la = {len(word_pairs)} total")
-        # Special handling for Spanish mixed mode
-        elif config.language_mode == LanguageMode.SPANISH and config.direction == Direction.SPANISH_MIXED:
-            # Preferred: lesson-based Spanish uses a single list. We sample once and alternate directions.
-            if available_words is not None:
+            if config.language_mode == LanguageMode.SPANISH and config.direction == Direction.SPANISH_MIXED:
+                # Lesson-based Spanish mixed mode: sample once and alternate directions
                 if config.use_all_words:
                     word_pairs = list(available_words)
                 else:
@@ -2720,114 +2753,47 @@ async def start_quiz(config: QuizConfig):
                     else:
                         word_pairs = available_words[:word_count]
 
-                for i, wp in enumerate(word_pairs):
-                    wp.actual_direction = Direction.SPANISH_TO_BULGARIAN if i % 2 == 0 else Direction.BULGARIAN_TO_SPANISH
+                # Copy rather than mutate: the sampled pairs are shared with the repository
+                word_pairs = [
+                    dataclasses.replace(
+                        wp, actual_direction=Direction.SPANISH_TO_BULGARIAN if i % 2 == 0 else Direction.BULGARIAN_TO_SPANISH
+                    )
+                    for i, wp in enumerate(word_pairs)
+                ]
 
-                print(f"[{get_timestamp()}] [DEBUG] Spanish mixed mode (single list): {len(word_pairs)} total")
+                logger.debug("Spanish mixed mode (single list): %d total", len(word_pairs))
             else:
-                # Legacy: interleave the two separate lists (no lessons)
-                es_bg_words = word_repo.spanish_es_bg
-                bg_es_words = word_repo.spanish_bg_es
-
-                if config.exclude_correct_words:
-                    print(f"[{get_timestamp()}] [DEBUG] Excluding {len(config.exclude_correct_words)} correct words from Spanish mixed mode")
-                    exclude_set = {
-                        (wp.get("spanish"), wp["bulgarian"]) 
-                        for wp in config.exclude_correct_words
-                    }
-                    es_bg_words = [wp for wp in es_bg_words if (wp.spanish, wp.bulgarian) not in exclude_set]
-                    bg_es_words = [wp for wp in bg_es_words if (wp.spanish, wp.bulgarian) not in exclude_set]
-                    print(f"[{get_timestamp()}] [DEBUG] After exclusion: {len(es_bg_words)} es→bg, {len(bg_es_words)} bg→es available")
-
-                if len(es_bg_words) == 0:
-                    es_bg_words = word_repo.spanish_es_bg
-                    print(f"[{get_timestamp()}] [INFO] All es→bg words mastered! Restarting with full set: {len(es_bg_words)} words")
-                if len(bg_es_words) == 0:
-                    bg_es_words = word_repo.spanish_bg_es
-                    print(f"[{get_timestamp()}] [INFO] All bg→es words mastered! Restarting with full set: {len(bg_es_words)} words")
-
+                # Determine word count
                 if config.use_all_words:
-                    count_es_bg = len(es_bg_words)
-                    count_bg_es = len(bg_es_words)
+                    word_count = len(available_words)
                 else:
-                    count_es_bg = config.count // 2
-                    count_bg_es = config.count - count_es_bg
-
+                    word_count = min(config.count, len(available_words))
+                
+                # Get word pairs - random or sequential based on config
                 if config.random_order:
-                    sampled_es_bg = random.sample(es_bg_words, min(count_es_bg, len(es_bg_words)))
-                    sampled_bg_es = random.sample(bg_es_words, min(count_bg_es, len(bg_es_words)))
+                    word_pairs = random.sample(available_words, word_count)
                 else:
-                    sampled_es_bg = es_bg_words[:count_es_bg]
-                    sampled_bg_es = bg_es_words[:count_bg_es]
-
-                word_pairs = []
-                max_len = max(len(sampled_es_bg), len(sampled_bg_es))
-                for i in range(max_len):
-                    if i < len(sampled_es_bg):
-                        wp = sampled_es_bg[i].model_copy()
-                        wp.actual_direction = Direction.SPANISH_TO_BULGARIAN
-                        word_pairs.append(wp)
-                    if i < len(sampled_bg_es):
-                        wp = sampled_bg_es[i].model_copy()
-                        wp.actual_direction = Direction.BULGARIAN_TO_SPANISH
-                        word_pairs.append(wp)
-
-                print(f"[{get_timestamp()}] [DEBUG] Spanish mixed mode (legacy): {len(sampled_es_bg)} es→bg + {len(sampled_bg_es)} bg→es = {len(word_pairs)} total")
-        else:
-            # Determine word count
-            if config.use_all_words:
-                word_count = len(available_words)
-            else:
-                word_count = min(config.count, len(available_words))
-            
-            # Get word pairs - random or sequential based on config
-            if config.random_order:
-                word_pairs = random.sample(available_words, word_count)
-            else:
-                word_pairs = available_words[:word_count]
+                    word_pairs = available_words[:word_count]
     
     # Create session with time limit
     session = session_manager.create_session(word_pairs, config.direction, config.time_per_question)
     
     # Debug logging for quiz start
-    print(f"\n[{get_timestamp()}] [DEBUG] Quiz Started:")
-    print(f"[{get_timestamp()}]   Session ID: {session.session_id}")
-    print(f"[{get_timestamp()}]   Language Mode: {config.language_mode}")
-    print(f"[{get_timestamp()}]   Direction: {config.direction}")
-    print(f"[{get_timestamp()}]   Word Count: {len(word_pairs)}")
-    print(f"[{get_timestamp()}]   Time per Question: {config.time_per_question}s")
-    if config.selected_lessons and config.language_mode in [LanguageMode.GREEK, LanguageMode.LATIN, LanguageMode.SPANISH]:
-        print(f"[{get_timestamp()}]   Selected Lessons: {sorted(config.selected_lessons)}")
-    print()
+    logger.debug(
+        "Quiz Started:\n  Session ID: %s\n  Language Mode: %s\n  Direction: %s\n  Word Count: %d\n"
+        "  Time per Question: %ss\n  Selected Lessons: %s",
+        session.session_id, config.language_mode, config.direction, len(word_pairs),
+        config.time_per_question, config.selected_lessons,
+    )
     
     # Start timer for first question
     session.start_question(0)
     
-    # Prepare questions
-    questions = [session.get_question(i) for i in range(len(word_pairs))]
+    # Questions were built once when the session was created
+    questions = session.questions
     
     # Return word pairs in response so they can be reused
-    word_pairs_dict = []
-    for wp in word_pairs:
-        if config.language_mode == LanguageMode.GREEK:
-            word_pairs_dict.append({
-                "greek": wp.greek, 
-                "bulgarian": wp.bulgarian, 
-                "lesson": wp.lesson
-            })
-        elif config.language_mode == LanguageMode.LATIN:
-            word_dict = {"latin": wp.latin, "bulgarian": wp.bulgarian, "lesson": wp.lesson}
-            if wp.actual_direction:
-                word_dict["actual_direction"] = wp.actual_direction
-            if wp.words:
-                word_dict["words"] = wp.words
-            word_pairs_dict.append(word_dict)
-        else:  # Spanish
-            word_dict = {"spanish": wp.spanish, "bulgarian": wp.bulgarian, "lesson": wp.lesson}
-            # Include actual_direction for mixed mode
-            if wp.actual_direction:
-                word_dict["actual_direction"] = wp.actual_direction
-            word_pairs_dict.append(word_dict)
+    word_pairs_dict = [wp.to_response_dict(language_field) for wp in word_pairs]
     
     return QuizStartResponse(
         session_id=session.session_id,
@@ -2839,8 +2805,8 @@ async def start_quiz(config: QuizConfig):
     )
 
 
-@app.get("/api/quiz/{session_id}/question/{question_index}")
-async def get_question_with_answer(session_id: str, question_index: int):
+@app.get("/api/quiz/{session_id}/question/{question_index}", response_class=JSONBytesResponse)
+def get_question_with_answer(session_id: str, question_index: int):
     """Get question with its correct answer (for training mode)"""
     session = session_manager.get_session(session_id)
     
@@ -2856,7 +2822,7 @@ async def get_question_with_answer(session_id: str, question_index: int):
         raise HTTPException(status_code=400, detail=str(e))
 
 @app.post("/api/quiz/{session_id}/answer", response_model=AnswerResponse)
-async def submit_answer(session_id: str, answer_req: AnswerRequest):
+def submit_answer(session_id: str, answer_req: AnswerRequest):
     """Submit an answer for a question"""
     session = session_manager.get_session(session_id)
     
@@ -2886,19 +2852,16 @@ async def submit_answer(session_id: str, answer_req: AnswerRequest):
             status = "TIMED OUT" if timed_out else f"SCORE {score_percent}%"
         else:
             status = "TIMED OUT" if timed_out else ("CORRECT" if score == 1.0 else ("PARTIAL CREDIT" if is_partial_credit else "WRONG"))
-        print(f"\n[{get_timestamp()}] [STUDENT ANSWER] Session: {session_id[:8]}... | Q{answer_req.question_index + 1}")
-        print(f"[{get_timestamp()}]   Question: {question['prompt']}")
-        print(f"[{get_timestamp()}]   Student answered: '{answer_req.answer}'")
-        print(f"[{get_timestamp()}]   Correct answer: '{correct_answer}'")
-        print(f"[{get_timestamp()}]   Status: {status} (score: {score})")
+        logger.info(
+            "[STUDENT ANSWER] Session: %s... | Q%d\n  Question: %s\n  Student answered: '%s'\n"
+            "  Correct answer: '%s'\n  Status: %s (score: %s)",
+            session_id[:8], answer_req.question_index + 1, question['prompt'], answer_req.answer,
+            correct_answer, status, score,
+        )
         
         # NOTE: Do NOT start timing for the next question here.
         # The next question should start when it is actually shown to the user.
         
-        # Calculate current score (sum of all scores, which can be 0.0, 0.5, or 1.0)
-        answered = [a for a in session.answers if a is not None]
-        total_score = sum(answered)
-        
         # Correctness rule: languages require 1.0; literature/verse uses threshold
         is_graded = score_percent is not None or getattr(session, "topic_id", None) is not None
         if is_graded and score_percent is not None:
@@ -2913,8 +2876,8 @@ async def submit_answer(session_id: str, answer_req: AnswerRequest):
             correct=correct_flag,
             user_answer=answer_req.answer,
             correct_answer=correct_answer,
-            current_score=total_score,
-            total_answered=len(answered),
+            current_score=session.total_score,
+            total_answered=session.total_answered,
             partial_credit=is_partial_credit,
             timed_out=timed_out,
             score_percent=score_percent,
@@ -2924,8 +2887,8 @@ async def submit_answer(session_id: str, answer_req: AnswerRequest):
         raise HTTPException(status_code=400, detail=str(e))
 
 
-@app.post("/api/quiz/{session_id}/question/{question_index}/start")
-async def start_question_timer(session_id: str, question_index: int):
+@app.post("/api/quiz/{session_id}/question/{question_index}/start", response_class=JSONBytesResponse)
+def start_question_timer(session_id: str, question_index: int):
     """Start the timer for a specific question index.
 
     This prevents timer desync where the backend starts counting down before the UI shows the next question.
@@ -2942,7 +2905,7 @@ async def start_question_timer(session_id: str, question_index: int):
         # If question already answered, don't change timing
         try:
             if session.answers[question_index] is not None:
-                started_at = session.question_start_times.get(question_index)
+                started_at = session.question_started_at(question_index)
                 return {
                     "question_index": question_index,
                     "started": started_at is not None,
@@ -2952,10 +2915,10 @@ async def start_question_timer(session_id: str, question_index: int):
         except Exception:
             pass
 
-    if question_index not in session.question_start_times:
+    if session.question_deadlines[question_index] is None:
         session.start_question(question_index)
 
-    started_at = session.question_start_times.get(question_index)
+    started_at = session.question_started_at(question_index)
     return {
         "question_index": question_index,
         "started": True,
@@ -2965,37 +2928,41 @@ async def start_question_timer(session_id: str, question_index: int):
 
 
 @app.get("/api/quiz/{session_id}/summary", response_model=QuizSummary)
-async def get_summary(session_id: str):
+def get_summary(session_id: str):
     """Get quiz summary"""
     session = session_manager.get_session(session_id)
     summary = session.get_summary()
     
-    # Debug logging for quiz results
-    print(f"\n[{get_timestamp()}] [DEBUG] Quiz Results for session {session_id}:")
-    print(f"[{get_timestamp()}]   Direction: {session.direction}")
-    print(f"[{get_timestamp()}]   Total Questions: {summary.total_questions}")
-    print(f"[{get_timestamp()}]   Correct Answers: {summary.correct_count}")
-    print(f"[{get_timestamp()}]   Score: {summary.score_percentage}%")
-    print(f"[{get_timestamp()}]   Incorrect: {len(summary.incorrect_words)}")
-    print(f"[{get_timestamp()}]   Partial Credit: {len(summary.partial_credit_words)}")
-    
-    if summary.incorrect_words:
-        print(f"\n[{get_timestamp()}]   Incorrect Answers:")
-        for word in summary.incorrect_words:
-            print(f"[{get_timestamp()}]     - {word['prompt']} → User: '{word['user_answer']}' | Correct: '{word['correct_answer']}'")
-    
-    if summary.partial_credit_words:
-        print(f"\n[{get_timestamp()}]   Partial Credit Answers:")
-        for word in summary.partial_credit_words:
-            print(f"[{get_timestamp()}]     - {word['prompt']} → User: '{word['user_answer']}' | Correct: '{word['correct_answer']}'")
-    
-    print()  # Empty line for readability
+    # Debug logging for quiz results (the per-word lines are only built when DEBUG is enabled)
+    if logger.isEnabledFor(logging.DEBUG):
+        lines = [
+            f"Quiz Results for session {session_id}:",
+            f"  Direction: {session.direction}",
+            f"  Total Questions: {summary.total_questions}",
+            f"  Correct Answers: {summary.correct_count}",
+            f"  Score: {summary.score_percentage}%",
+            f"  Incorrect: {len(summary.incorrect_words)}",
+            f"  Partial Credit: {len(summary.partial_credit_words)}",
+        ]
+        if summary.incorrect_words:
+            lines.append("  Incorrect Answers:")
+            lines.extend(
+                f"    - {word['prompt']} → User: '{word['user_answer']}' | Correct: '{word['correct_answer']}'"
+                for word in summary.incorrect_words
+            )
+        if summary.partial_credit_words:
+            lines.append("  Partial Credit Answers:")
+            lines.extend(
+                f"    - {word['prompt']} → User: '{word['user_answer']}' | Correct: '{word['correct_answer']}'"
+                for word in summary.partial_credit_words
+            )
+        logger.debug("\n".join(lines))
     
     return summary
 
 
-@app.delete("/api/quiz/{session_id}")
-async def delete_quiz(session_id: str):
+@app.delete("/api/quiz/{session_id}", response_class=JSONBytesResponse)
+def delete_quiz(session_id: str):
     """Delete a quiz session"""
     session_manager.delete_session(session_id)
     return {"message": "Session deleted"}
@@ -3038,8 +3005,8 @@ def _get_cross_exam_repo(subject: str):
     return factory()
 
 
-@app.post("/api/{subject}/cross-exam/start")
-async def start_cross_exam(subject: str, req: CrossExamStartRequest):
+@app.post("/api/{subject}/cross-exam/start", response_class=JSONBytesResponse)
+def start_cross_exam(subject: str, req: CrossExamStartRequest):
     """Generate fresh cross-exam questions from the lesson's source markdown and start a session."""
     repo = _get_cross_exam_repo(subject)
     topic = repo.get_topic(req.topic_id)
@@ -3049,7 +3016,7 @@ async def start_cross_exam(subject: str, req: CrossExamStartRequest):
     source_content = cross_exam_generator.load_source(topic.source)
     questions = cross_exam_generator.generate_questions(source_content, req.count, subject=subject)
 
-    session_id = str(uuid4())
+    session_id = new_session_id()
     session = CrossExamSession(
         session_id=session_id,
         topic_id=req.topic_id,
@@ -3058,7 +3025,7 @@ async def start_cross_exam(subject: str, req: CrossExamStartRequest):
     )
     cross_exam_sessions[session_id] = session
 
-    print(f"[{get_timestamp()}] 🔬 Cross-exam started: subject={subject} session={session_id} topic={req.topic_id} questions={len(questions)}")
+    logger.info("🔬 Cross-exam started: subject=%s session=%s topic=%s questions=%d", subject, session_id, req.topic_id, len(questions))
     return {
         "session_id": session_id,
         "topic_id": req.topic_id,
@@ -3067,8 +3034,8 @@ async def start_cross_exam(subject: str, req: CrossExamStartRequest):
     }
 
 
-@app.post("/api/{subject}/cross-exam/{session_id}/answer")
-async def answer_cross_exam(subject: str, session_id: str, req: CrossExamAnswerRequest):
+@app.post("/api/{subject}/cross-exam/{session_id}/answer", response_class=JSONBytesResponse)
+def answer_cross_exam(subject: str, session_id: str, req: CrossExamAnswerRequest):
     """Submit and evaluate one answer. Returns score and feedback."""
     _get_cross_exam_repo(subject)  # validate subject
     session = cross_exam_sessions.get(session_id)
@@ -3083,7 +3050,7 @@ async def answer_cross_exam(subject: str, session_id: str, req: CrossExamAnswerR
     score, notes = cross_exam_generator.evaluate_answer(session.source_content, question, req.answer, subject=subject)
     session.record_answer(idx, req.answer, score, notes)
 
-    print(f"[{get_timestamp()}] 🔬 Cross-exam answer: subject={subject} session={session_id} q={idx} score={score}%")
+    logger.info("🔬 Cross-exam answer: subject=%s session=%s q=%s score=%s%%", subject, session_id, idx, score)
     return {
         "question_index": idx,
         "question": question,
@@ -3094,8 +3061,8 @@ async def answer_cross_exam(subject: str, session_id: str, req: CrossExamAnswerR
     }
 
 
-@app.get("/api/{subject}/cross-exam/{session_id}/summary")
-async def get_cross_exam_summary(subject: str, session_id: str):
+@app.get("/api/{subject}/cross-exam/{session_id}/summary", response_class=JSONBytesResponse)
+def get_cross_exam_summary(subject: str, session_id: str):
     """Return the full summary for a cross-exam session."""
     _get_cross_exam_repo(subject)  # validate subject
     session = cross_exam_sessions.get(session_id)
@@ -3104,8 +3071,8 @@ async def get_cross_exam_summary(subject: str, session_id: str):
     return session.get_summary()
 
 
-@app.post("/api/{subject}/cross-exam/retake")
-async def retake_cross_exam(subject: str, req: CrossExamRetakeRequest):
+@app.post("/api/{subject}/cross-exam/retake", response_class=JSONBytesResponse)
+def retake_cross_exam(subject: str, req: CrossExamRetakeRequest):
     """Create a new session reusing the same questions (or just failed ones) from a previous session."""
     _get_cross_exam_repo(subject)  # validate subject
     original = cross_exam_sessions.get(req.session_id)
@@ -3123,7 +3090,7 @@ async def retake_cross_exam(subject: str, req: CrossExamRetakeRequest):
     else:
         questions = list(original.questions)
 
-    session_id = str(uuid4())
+    session_id = new_session_id()
     session = CrossExamSession(
         session_id=session_id,
         topic_id=original.topic_id,
@@ -3132,7 +3099,10 @@ async def retake_cross_exam(subject: str, req: CrossExamRetakeRequest):
     )
     cross_exam_sessions[session_id] = session
 
-    print(f"[{get_timestamp()}] 🔬 Cross-exam retake: subject={subject} session={session_id} from={req.session_id} failed_only={req.failed_only} questions={len(questions)}")
+    logger.info(
+        "🔬 Cross-exam retake: subject=%s session=%s from=%s failed_only=%s questions=%d",
+        subject, session_id, req.session_id, req.failed_only, len(questions),
+    )
     return {
         "session_id": session_id,
         "topic_id": session.topic_id,
@@ -3141,8 +3111,8 @@ async def retake_cross_exam(subject: str, req: CrossExamRetakeRequest):
     }
 
 
-@app.post("/api/{subject}/cross-exam/resume")
-async def resume_cross_exam(subject: str, req: CrossExamResumeRequest):
+@app.post("/api/{subject}/cross-exam/resume", response_class=JSONBytesResponse)
+def resume_cross_exam(subject: str, req: CrossExamResumeRequest):
     """Create a new session from a client-saved question list (e.g. restored from localStorage after a page refresh)."""
     repo = _get_cross_exam_repo(subject)
     topic = repo.get_topic(req.topic_id)
@@ -3155,7 +3125,7 @@ async def resume_cross_exam(subject: str, req: CrossExamResumeRequest):
 
     source_content = cross_exam_generator.load_source(topic.source)
 
-    session_id = str(uuid4())
+    session_id = new_session_id()
     session = CrossExamSession(
         session_id=session_id,
         topic_id=req.topic_id,
@@ -3164,7 +3134,7 @@ async def resume_cross_exam(subject: str, req: CrossExamResumeRequest):
     )
     cross_exam_sessions[session_id] = session
 
-    print(f"[{get_timestamp()}] 🔬 Cross-exam resume: subject={subject} session={session_id} topic={req.topic_id} questions={len(questions)}")
+    logger.info("🔬 Cross-exam resume: subject=%s session=%s topic=%s questions=%d", subject, session_id, req.topic_id, len(questions))
     return {
         "session_id": session_id,
         "topic_id": req.topic_id,
@@ -3182,13 +3152,13 @@ STUDY_GUIDE_REPOS = {
     "chemistry": lambda: chemistry_repo,
 }
 
-@app.get("/api/biology/study-guide/{topic_id}")
-async def get_biology_study_guide(topic_id: str):
+@app.get("/api/biology/study-guide/{topic_id}", response_class=JSONBytesResponse)
+def get_biology_study_guide(topic_id: str):
     """Return the structured study guide for a biology topic."""
     return biology_repo.get_study_guide(topic_id)
 
-@app.get("/api/study-guide/{subject}/{topic_id}")
-async def get_study_guide(subject: str, topic_id: str):
+@app.get("/api/study-guide/{subject}/{topic_id}", response_class=JSONBytesResponse)
+def get_study_guide(subject: str, topic_id: str):
     """Return the structured study guide for any subject."""
     if subject not in STUDY_GUIDE_REPOS:
         raise HTTPException(status_code=400, detail=f"Unknown subject: {subject}")
@@ -3202,7 +3172,7 @@ app.mount("/static", StaticFiles(directory="static"), name="static")
 
 
 @app.get("/")
-async def serve_frontend():
+def serve_frontend():
     """Serve the frontend HTML"""
     return FileResponse("static/index.html")
 
@@ -6,6 +6,7 @@ with two-column table layout using WeasyPrint.
 
 import json
 import sys
+from html import escape
 from pathlib import Path
 from datetime import datetime
 from weasyprint import HTML, CSS
@@ -49,7 +50,7 @@ def generate_latin_pdf(input_file_la_bg, input_file_bg_la, output_file, directio
         "both": "Latin ↔ Bulgarian"
     }[direction]
     
-    html_content = f"""
+    html_parts = [f"""
     <!DOCTYPE html>
     <html>
     <head>
@@ -128,11 +129,11 @@ def generate_latin_pdf(input_file_la_bg, input_file_bg_la, output_file, directio
     <body>
         <h1>Латински Фрази - {direction_title}</h1>
         <div class="phrase-info">Сборник с латински фрази и изрази</div>
-    """
+    """]
     
     # Add Latin → Bulgarian section
     if direction in ["la_bg", "both"]:
-        html_content += """
+        html_parts.append("""
         <h2>Latin → Български</h2>
         <table>
             <thead>
@@ -142,26 +143,23 @@ def generate_latin_pdf(input_file_la_bg, input_file_bg_la, output_file, directio
                 </tr>
             </thead>
             <tbody>
-        """
+        """)
         
-        for phrase in data_la_bg:
-            latin = phrase["la"]
-            bulgarian = phrase["bg"]
-            html_content += f"""
+        html_parts.extend(f"""
                 <tr>
-                    <td>{latin}</td>
-                    <td>{bulgarian}</td>
+                    <td>{escape(phrase["la"], quote=False)}</td>
+                    <td>{escape(phrase["bg"], quote=False)}</td>
                 </tr>
-            """
+            """ for phrase in data_la_bg)
         
-        html_content += """
+        html_parts.append("""
             </tbody>
         </table>
-        """
+        """)
     
     # Add Bulgarian → Latin section
     if direction in ["bg_la", "both"]:
-        html_content += """
+        html_parts.append("""
         <h2>Български → Latin</h2>
         <table>
             <thead>
@@ -171,50 +169,47 @@ def generate_latin_pdf(input_file_la_bg, input_file_bg_la, output_file, directio
                 </tr>
             </thead>
             <tbody>
-        """
+        """)
         
-        for phrase in data_bg_la:
-            latin = phrase["la"]
-            bulgarian = phrase["bg"]
-            html_content += f"""
+        html_parts.extend(f"""
                 <tr>
-                    <td>{bulgarian}</td>
-                    <td>{latin}</td>
+                    <td>{escape(phrase["bg"], quote=False)}</td>
+                    <td>{escape(phrase["la"], quote=False)}</td>
                 </tr>
-            """
+            """ for phrase in data_bg_la)
         
-        html_content += """
+        html_parts.append("""
             </tbody>
         </table>
-        """
+        """)
     
     # Add summary
-    html_content += """
+    html_parts.append("""
         <div class="summary">
-    """
+    """)
     
     if direction == "both":
         total = len(data_la_bg) + len(data_bg_la)
-        html_content += f"""
+        html_parts.append(f"""
             Общо фрази: {total} ({len(data_la_bg)} Latin→Bulgarian + {len(data_bg_la)} Bulgarian→Latin)
-        """
+        """)
     elif direction == "la_bg":
-        html_content += f"""
+        html_parts.append(f"""
             Общо фрази: {len(data_la_bg)}
-        """
+        """)
     else:
-        html_content += f"""
+        html_parts.append(f"""
             Общо фрази: {len(data_bg_la)}
-        """
+        """)
     
-    html_content += """
+    html_parts.append("""
         </div>
     </body>
     </html>
-    """
+    """)
     
     # Generate PDF
-    HTML(string=html_content).write_pdf(output_file)
+    HTML(string="".join(html_parts)).write_pdf(output_file)
     
     print(f"[{get_timestamp()}] ✓ Generated Latin phrases PDF: {output_file}")
     print(f"[{get_timestamp()}]   Direction: {direction_title}")
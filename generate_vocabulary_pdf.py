@@ -5,6 +5,7 @@ with two-column table layout using WeasyPrint.
 """
 
 import json
+from html import escape
 from pathlib import Path
 from datetime import datetime
 from weasyprint import HTML, CSS
@@ -29,16 +30,15 @@ def generate_vocabulary_pdf(input_file, output_file, lessons):
         data = json.load(f)
     
     # Filter words for specified lessons
-    words_by_lesson = {}
-    for lesson in lessons:
-        words_by_lesson[lesson] = [
-            item for item in data 
-            if item.get("Урок") == lesson
-        ]
+    words_by_lesson = {lesson: [] for lesson in lessons}
+    for item in data:
+        bucket = words_by_lesson.get(item.get("Урок"))
+        if bucket is not None:
+            bucket.append(item)
     
     # Build HTML content
     lessons_title = ", ".join(str(l) for l in lessons)
-    html_content = f"""
+    html_parts = [f"""
     <!DOCTYPE html>
     <html>
     <head>
@@ -116,53 +116,53 @@ def generate_vocabulary_pdf(input_file, output_file, lessons):
     </head>
     <body>
         <h1>Старогръцки Речник - Уроци {lessons_title}</h1>
-    """
+    """]
     
     for lesson in lessons:
         words = words_by_lesson[lesson]
         
         # Add page break before lesson 31 to keep it with its table
         if lesson == 31:
-            html_content += '<div style="page-break-before: always;"></div>'
+            html_parts.append('<div style="page-break-before: always;"></div>')
         
-        html_content += f"""
+        html_parts.append(f"""
         <h2>Урок {lesson}</h2>
         <div class="lesson-info">Общо думи: {len(words)}</div>
-        """
+        """)
         
         # Split words into two halves
         mid_point = (len(words) + 1) // 2
         left_words = words[:mid_point]
         right_words = words[mid_point:]
         
-        html_content += '<div class="two-column-container">'
+        html_parts.append('<div class="two-column-container">')
         
         # Left column
-        html_content += '<div class="column"><table><thead><tr><th>Гръцки</th><th>Превод</th></tr></thead><tbody>'
-        for word in left_words:
-            greek = word.get("Лема", "")
-            bulgarian = word.get("Превод", "")
-            html_content += f'<tr><td>{greek}</td><td>{bulgarian}</td></tr>'
-        html_content += '</tbody></table></div>'
+        html_parts.append('<div class="column"><table><thead><tr><th>Гръцки</th><th>Превод</th></tr></thead><tbody>')
+        html_parts.extend(
+            f'<tr><td>{escape(word.get("Лема", ""), quote=False)}</td><td>{escape(word.get("Превод", ""), quote=False)}</td></tr>'
+            for word in left_words
+        )
+        html_parts.append('</tbody></table></div>')
         
         # Right column
-        html_content += '<div class="column"><table><thead><tr><th>Гръцки</th><th>Превод</th></tr></thead><tbody>'
-        for word in right_words:
-            greek = word.get("Лема", "")
-            bulgarian = word.get("Превод", "")
-            html_content += f'<tr><td>{greek}</td><td>{bulgarian}</td></tr>'
-        html_content += '</tbody></table></div>'
+        html_parts.append('<div class="column"><table><thead><tr><th>Гръцки</th><th>Превод</th></tr></thead><tbody>')
+        html_parts.extend(
+            f'<tr><td>{escape(word.get("Лема", ""), quote=False)}</td><td>{escape(word.get("Превод", ""), quote=False)}</td></tr>'
+            for word in right_words
+        )
+        html_parts.append('</tbody></table></div>')
         
-        html_content += '</div>'
+        html_parts.append('</div>')
     
     # Close HTML
-    html_content += """
+    html_parts.append("""
     </body>
     </html>
-    """
+    """)
     
     # Generate PDF
-    HTML(string=html_content).write_pdf(output_file)
+    HTML(string="".join(html_parts)).write_pdf(output_file)
     
     # Calculate total for reporting
     total_words = sum(len(words_by_lesson[lesson]) for lesson in lessons)
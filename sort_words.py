@@ -2,20 +2,26 @@
 Sort Greek words by lesson number, then alphabetically by lemma (ignoring accents and diacritics)
 """
 import json
+import re
 import unicodedata
+from functools import lru_cache
 from pathlib import Path
 
+# Combining Diacritical Marks block: Greek accents, breathings and iota subscript all decompose into it
+COMBINING_MARKS_RE = re.compile('[\u0300-\u036f]')
 
+
+@lru_cache(maxsize=None)
 def remove_accents(text: str) -> str:
     """
     Remove accents and diacritics from Greek text for sorting purposes.
-    Normalizes the text using NFD (decomposed form) and filters out combining marks.
+    Normalizes the text using NFD (decomposed form) and strips the combining marks.
+    Cached because lemmas repeat across lessons and files.
     """
     # Normalize to NFD (decomposed form where accents are separate characters)
     nfd = unicodedata.normalize('NFD', text)
-    # Filter out combining characters (accents, breathing marks, etc.)
-    without_accents = ''.join(char for char in nfd if unicodedata.category(char) != 'Mn')
-    return without_accents
+    # Remove combining characters (accents, breathing marks, etc.) in one regex pass
+    return COMBINING_MARKS_RE.sub('', nfd)
 
 
 def sort_greek_words(input_file: str, output_file: str = None):
@@ -38,6 +44,11 @@ def sort_greek_words(input_file: str, output_file: str = None):
     # Sort by lesson number first, then by lemma without accents
     sorted_words = sorted(words, key=lambda x: (x.get('Урок', 0), remove_accents(x['Лема'].lower())))
     
+    # Already in order: leave the file untouched (the sort itself is linear on sorted input)
+    if output_file == input_file and sorted_words == words:
+        print(f"{input_file} is already sorted, skipping write")
+        return
+    
     # Write back to file with pretty formatting
     with open(output_file, 'w', encoding='utf-8') as f:
         json.dump(sorted_words, f, ensure_ascii=False, indent=4)
@@ -2,15 +2,20 @@
 """
 Test script for Ancient Greek Language Trainer API
 """
-import requests
 import json
 
-BASE_URL = "http://localhost:8000/api"
+from fastapi.testclient import TestClient
+
+from app import app
+
+BASE_URL = "/api"
+# Requests are dispatched to the app in-process, so no server needs to be running
+client = TestClient(app)
 
 def test_config():
     """Test GET /api/config endpoint"""
     print("Testing GET /api/config...")
-    response = requests.get(f"{BASE_URL}/config")
+    response = client.get(f"{BASE_URL}/config")
     print(f"Status: {response.status_code}")
     data = response.json()
     print(json.dumps(data, indent=2, ensure_ascii=False))
@@ -26,7 +31,7 @@ def test_quiz_flow():
     
     # Start quiz
     print("1. Starting quiz with 5 words (Greek → Bulgarian)...")
-    response = requests.post(
+    response = client.post(
         f"{BASE_URL}/quiz",
         json={"count": 5, "direction": "greek_to_bulgarian"}
     )
@@ -43,7 +48,7 @@ def test_quiz_flow():
     for i in range(min(3, len(quiz_data['questions']))):
         question = quiz_data['questions'][i]
         # Submit intentionally wrong answer for testing
-        answer_response = requests.post(
+        answer_response = client.post(
             f"{BASE_URL}/quiz/{session_id}/answer",
             json={"question_index": i, "answer": "test answer"}
         )
@@ -56,7 +61,7 @@ def test_quiz_flow():
     
     # Get summary
     print("3. Getting quiz summary...")
-    summary_response = requests.get(f"{BASE_URL}/quiz/{session_id}/summary")
+    summary_response = client.get(f"{BASE_URL}/quiz/{session_id}/summary")
     assert summary_response.status_code == 200
     summary = summary_response.json()
     print(f"   Score: {summary['score_percentage']}%")
@@ -69,7 +74,7 @@ def test_quiz_flow():
 def test_bulgarian_to_greek():
     """Test Bulgarian to Greek direction"""
     print("Testing Bulgarian → Greek direction...")
-    response = requests.post(
+    response = client.post(
         f"{BASE_URL}/quiz",
         json={"count": 3, "direction": "bulgarian_to_greek"}
     )
@@ -86,18 +91,36 @@ def test_error_handling():
     
     # Invalid session
     print("1. Testing invalid session ID...")
-    response = requests.get(f"{BASE_URL}/quiz/invalid-session-id/summary")
+    response = client.get(f"{BASE_URL}/quiz/invalid-session-id/summary")
     assert response.status_code == 404
     print("   ✓ Returns 404 for invalid session\n")
     
     # Invalid direction
     print("2. Testing invalid direction...")
-    response = requests.post(
+    response = client.post(
         f"{BASE_URL}/quiz",
         json={"count": 5, "direction": "invalid_direction"}
     )
     assert response.status_code == 400
     print("   ✓ Returns 400 for invalid direction\n")
+    
+    # Reused word pair without its Bulgarian side
+    print("3. Testing malformed reused word pair...")
+    response = client.post(
+        f"{BASE_URL}/quiz",
+        json={"direction": "bulgarian_to_greek", "word_pairs": [{"greek": "θεός"}]}
+    )
+    assert response.status_code == 400
+    print("   ✓ Returns 400 for malformed word_pairs\n")
+    
+    # Lesson selection that isn't a list of numbers
+    print("4. Testing malformed selected_lessons...")
+    response = client.post(
+        f"{BASE_URL}/words-count",
+        json={"language_mode": "greek", "selected_lessons": [[1]]}
+    )
+    assert response.status_code == 400
+    print("   ✓ Returns 400 for malformed selected_lessons\n")
 
 def main():
     """Run all tests"""
@@ -106,14 +129,6 @@ def main():
     print("=" * 60 + "\n")
     
     try:
-        # Verify server is running
-        try:
-            requests.get(f"{BASE_URL}/config", timeout=2)
-        except requests.exceptions.RequestException:
-            print("❌ Server is not running!")
-            print("Please start the server with: python app.py")
-            return
-        
         test_config()
         test_quiz_flow()
         test_bulgarian_to_greek()
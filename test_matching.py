@@ -2,25 +2,9 @@
 """
 Test answer matching improvements
 """
-import unicodedata
 import re
 
-def normalize_answer(text: str) -> str:
-    """Normalize text for comparison (case-insensitive, trim, remove extra spaces and punctuation)"""
-    # Remove diacritics for Greek text comparison
-    text = ''.join(
-        c for c in unicodedata.normalize('NFD', text)
-        if unicodedata.category(c) != 'Mn'
-    )
-    # Convert to lowercase and normalize whitespace
-    text = text.lower().strip()
-    # Normalize common punctuation variations
-    text = text.replace('(', ' ').replace(')', ' ')
-    text = text.replace('[', ' ').replace(']', ' ')
-    text = text.replace('.', ' ').replace(',', ' ')
-    text = text.replace(';', ' ').replace(':', ' ')
-    text = text.replace('  ', ' ')  # Double spaces to single
-    return ' '.join(text.split())  # Remove all extra whitespace
+from app import normalize_answer
 
 def check_answer(user_answer: str, correct_answer: str) -> bool:
     """Check if answer is correct"""
@@ -2,22 +2,9 @@
 """
 Test specific case: without periods in abbreviations
 """
-import unicodedata
 import re
 
-def normalize_answer(text: str) -> str:
-    """Normalize text for comparison"""
-    text = ''.join(
-        c for c in unicodedata.normalize('NFD', text)
-        if unicodedata.category(c) != 'Mn'
-    )
-    text = text.lower().strip()
-    text = text.replace('(', ' ').replace(')', ' ')
-    text = text.replace('[', ' ').replace(']', ' ')
-    text = text.replace('.', ' ').replace(',', ' ')
-    text = text.replace(';', ' ').replace(':', ' ')
-    text = text.replace('  ', ' ')
-    return ' '.join(text.split())
+from app import normalize_answer
 
 def check_answer(user_answer: str, correct_answer: str) -> bool:
     normalized_user = normalize_answer(user_answer)
@@ -1,10 +1,19 @@
 """
 Test the timer functionality for quiz questions
 """
-import time
 from app import QuizSession, WordPair, Direction
 
 
+class FakeClock:
+    """Stand-in for time.monotonic that only moves when a test advances it"""
+
+    def __init__(self, t: float = 1000.0):
+        self.t = t
+
+    def __call__(self) -> float:
+        return self.t
+
+
 def test_timer_within_limit():
     """Test that answers submitted within time limit are accepted"""
     print("Test 1: Answer within time limit")
@@ -14,14 +23,12 @@ def test_timer_within_limit():
         WordPair(greek="θεός", bulgarian="бог")
     ]
     
+    # Uses the real monotonic clock: answering straight away is well inside the 5 second limit
     session = QuizSession("test-1", word_pairs, Direction.GREEK_TO_BULGARIAN, time_per_question=5)
     
     # Start question
     session.start_question(0)
     
-    # Answer within time (wait 1 second)
-    time.sleep(1)
-    
     score, is_partial, timed_out = session.check_answer(0, "човек")
     
     assert score == 1.0, f"Expected score 1.0, got {score}"
@@ -41,14 +48,14 @@ def test_timer_expired():
         WordPair(greek="θεός", bulgarian="бог")
     ]
     
-    session = QuizSession("test-2", word_pairs, Direction.GREEK_TO_BULGARIAN, time_per_question=2)
+    clock = FakeClock()
+    session = QuizSession("test-2", word_pairs, Direction.GREEK_TO_BULGARIAN, time_per_question=2, clock=clock)
     
     # Start question
     session.start_question(0)
     
-    # Wait for timer to expire (wait 3 seconds, limit is 2)
-    print("   Waiting for timer to expire (3 seconds)...")
-    time.sleep(3)
+    # Let the timer expire (3 seconds pass, limit is 2)
+    clock.t += 3
     
     # Try to answer after timeout - even with correct answer
     score, is_partial, timed_out = session.check_answer(0, "човек")
@@ -68,13 +75,14 @@ def test_timer_partial_credit_within_limit():
         WordPair(greek="ἄνθρωπος", bulgarian="човек")
     ]
     
-    session = QuizSession("test-3", word_pairs, Direction.GREEK_TO_BULGARIAN, time_per_question=5)
+    clock = FakeClock()
+    session = QuizSession("test-3", word_pairs, Direction.GREEK_TO_BULGARIAN, time_per_question=5, clock=clock)
     
     # Start question
     session.start_question(0)
     
     # Answer within time but without accents (if applicable to Bulgarian)
-    time.sleep(1)
+    clock.t += 1
     
     score, is_partial, timed_out = session.check_answer(0, "човек")
     
@@ -92,14 +100,14 @@ def test_timer_wrong_answer_expired():
         WordPair(greek="ἄνθρωπος", bulgarian="човек")
     ]
     
-    session = QuizSession("test-4", word_pairs, Direction.GREEK_TO_BULGARIAN, time_per_question=2)
+    clock = FakeClock()
+    session = QuizSession("test-4", word_pairs, Direction.GREEK_TO_BULGARIAN, time_per_question=2, clock=clock)
     
     # Start question
     session.start_question(0)
     
-    # Wait for timer to expire
-    print("   Waiting for timer to expire (3 seconds)...")
-    time.sleep(3)
+    # Let the timer expire
+    clock.t += 3
     
     # Submit wrong answer
     score, is_partial, timed_out = session.check_answer(0, "wrong answer")
@@ -121,25 +129,25 @@ def test_multiple_questions_timer():
         WordPair(greek="γυνή", bulgarian="жена")
     ]
     
-    session = QuizSession("test-5", word_pairs, Direction.GREEK_TO_BULGARIAN, time_per_question=2)
+    clock = FakeClock()
+    session = QuizSession("test-5", word_pairs, Direction.GREEK_TO_BULGARIAN, time_per_question=2, clock=clock)
     
     # Question 0 - answer within time
     session.start_question(0)
-    time.sleep(0.5)
+    clock.t += 0.5
     score0, partial0, timeout0 = session.check_answer(0, "човек")
     assert not timeout0, "Question 0 should not timeout"
     
     # Question 1 - let it timeout
     session.start_question(1)
-    print("   Waiting for question 1 to timeout (3 seconds)...")
-    time.sleep(3)
+    clock.t += 3
     score1, partial1, timeout1 = session.check_answer(1, "бог")
     assert timeout1, "Question 1 should timeout"
     assert score1 == 0.0, "Timed out question should score 0"
     
     # Question 2 - answer within time
     session.start_question(2)
-    time.sleep(0.5)
+    clock.t += 0.5
     score2, partial2, timeout2 = session.check_answer(2, "жена")
     assert not timeout2, "Question 2 should not timeout"
     